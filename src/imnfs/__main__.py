@@ -0,0 +1,59 @@
+"""
+Command line entry point (`imnfs-run` / `python -m imnfs`).
+
+    imnfs-run calibrate [--output PATH] [--quick]
+    imnfs-run plan DATA --cost 0 2 [--measure 4]
+"""
+
+import argparse
+import json
+import sys
+
+from imnfs.core.planner import ExecutionPlanner, calibrate, save_profile, load_profile
+
+
+def _calibrate(args) -> int:
+    profile = calibrate(quick=args.quick)
+    path = save_profile(profile, args.output)
+    print(json.dumps(profile, indent=2))
+    print(f"Calibration profile written to {path}")
+    return 0
+
+
+def _plan(args) -> int:
+    from imnfs.io import load_nf_tensor
+    from imnfs.model import NFSet, RNF
+
+    rnf = RNF(NFSet(load_nf_tensor(args.data)), cost=args.cost)
+    planner = ExecutionPlanner(profile=load_profile(args.profile), memory_budget=args.memory_budget)
+    plan = planner.plan(rnf)
+    print(json.dumps(plan.to_dict(), indent=2))
+    if args.measure is not None:
+        scores = plan.compute_normalized_scores(rnf, args.measure)
+        print(json.dumps({"measure": args.measure, "scores": scores}, indent=2))
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="imnfs-run", description="IMNFS command line tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    cal = commands.add_parser("calibrate", help="Time every execution strategy and save the profile.")
+    cal.add_argument("--output", help="Profile path (default: $IMNFS_PROFILE or ~/.imnfs/calibration.json)")
+    cal.add_argument("--quick", action="store_true", help="Use small problems (faster, less accurate)")
+    cal.set_defaults(func=_calibrate)
+
+    plan = commands.add_parser("plan", help="Show the execution plan chosen for a data file.")
+    plan.add_argument("data", help="NF data file (JSON, TXT, CSV or XLSX)")
+    plan.add_argument("--cost", type=int, nargs="*", default=[], help="Indices of cost criteria")
+    plan.add_argument("--measure", type=int, help="Also compute the normalized scores with this measure")
+    plan.add_argument("--profile", help="Calibration profile to use")
+    plan.add_argument("--memory-budget", type=int, help="Bytes available for temporaries")
+    plan.set_defaults(func=_plan)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
 from .decision_maker import DecisionMaker
+from .planner import ExecutionPlanner, ExecutionPlan, calibrate
+from .results import DecisionResults, RunLog, evaluate, fingerprint
 
-__all__=["DecisionMaker"]
\ No newline at end of file
+__all__=["DecisionMaker", "ExecutionPlanner", "ExecutionPlan", "calibrate",
+         "DecisionResults", "RunLog", "evaluate", "fingerprint"]
\ No newline at end of file
@@ -1,7 +1,12 @@
 import numpy as np
 from imnfs.model import RNF
 from imnfs.operations import compute_normalized_scores
-from imnfs.exceptions import InvalidTypeError, InvalidIndexError, CalculationError
+from imnfs.operations.ranking_calculator import (
+    weighted_reference_scores,
+    POSITIVE_REFERENCE,
+    NEGATIVE_REFERENCE,
+)
+from imnfs.exceptions import InvalidTypeError, InvalidIndexError, CalculationError, ShapeMismatchError
 
 
 class DecisionMaker:
@@ -10,13 +15,17 @@ class DecisionMaker:
     computes scores, ranks alternatives, and identifies the best one.
     """
 
-    def __init__(self, rnf: RNF, index: int):
+    def __init__(self, rnf: RNF, index: int, planner=None, weights=None):
         """
         Initialize DecisionMaker.
 
         Args:
             rnf (RNF): RNF object (contains 3D NF data array)
             index (int): Index of the component (Mu/T/I/F)
+            planner (ExecutionPlanner, optional): Chooses how scores are computed;
+                the chosen plan is exposed as `plan`. Defaults to the standard operations.
+            weights (array-like, optional): Precomputed criteria weights for this measure
+                (e.g. from a warm-start state); only the S+ / S- scoring is then computed.
         """
         if not isinstance(rnf, RNF):
             raise InvalidTypeError("rnf must be an instance of RNF.")
@@ -25,6 +34,22 @@ class DecisionMaker:
 
         self.rnf = rnf
         self.index = index
+        self.plan = planner.plan(rnf) if planner is not None else None
+        self.weights = None if weights is None else np.asarray(weights, dtype=float)
+        if self.weights is not None and self.weights.shape != (rnf.data.shape[0],):
+            raise ShapeMismatchError(self.weights.shape, (rnf.data.shape[0],))
+
+    def _scores(self) -> np.ndarray:
+        """Normalized scores of every alternative, as an array."""
+        if self.weights is not None:
+            data = self.rnf.components if self.rnf.layout == "soa" else self.rnf.data
+            axis = self.rnf.component_axis
+            spos = weighted_reference_scores(data, self.weights, POSITIVE_REFERENCE, self.index, axis)
+            sneg = weighted_reference_scores(data, self.weights, NEGATIVE_REFERENCE, self.index, axis)
+            return spos / (spos + sneg)
+        if self.plan is None:
+            return np.asarray(compute_normalized_scores(self.rnf, self.index))
+        return np.asarray(self.plan.compute_normalized_scores(self.rnf, self.index))
 
     def rank(self) -> np.ndarray:
         """
@@ -34,7 +59,7 @@ class DecisionMaker:
             np.ndarray: Rank indices (1 = lowest rank)
         """
         try:
-            scores = compute_normalized_scores(self.rnf, self.index)
+            scores = self._scores()
             if not isinstance(scores, np.ndarray):
                 raise CalculationError("compute_normalized_scores must return a NumPy array.")
             return np.argsort(scores) + 1
@@ -49,7 +74,21 @@ class DecisionMaker:
             int: Index of the best alternative (1-based)
         """
         try:
-            scores = compute_normalized_scores(self.rnf, self.index)
+            scores = self._scores()
             return int(np.argmax(scores) + 1)
         except Exception as e:
             raise CalculationError(f"Error during best alternative selection: {e}")
+
+    def results(self, measures=None):
+        """
+        Weights, S+, S-, scores and ranks as contiguous arrays.
+
+        Args:
+            measures (Iterable[int], optional): Measures to evaluate. Defaults to this DecisionMaker's index.
+
+        Returns:
+            DecisionResults: Columnar results, writable in bulk to .npz / Parquet / Feather.
+        """
+        from imnfs.core.results import evaluate
+        weights = {self.index: self.weights} if self.weights is not None else None
+        return evaluate(self.rnf, [self.index] if measures is None else measures, self.plan, weights)
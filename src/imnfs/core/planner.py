@@ -0,0 +1,364 @@
+"""
+Execution planning for the entropy, cross-entropy and scoring stages.
+
+The planner estimates the run time and peak temporary memory of every
+strategy from the shape and dtype of `RNF.data`, the memory budget, the
+core count and a calibration profile, then picks the fastest feasible one:
+
+    - "loop":       per-pair Python loops (reference implementation)
+    - "graded":     exact count-based path for data on a grade scale
+    - "vectorized": one broadcast over all alternative pairs
+    - "tiled":      pairwise broadcast in row tiles sized to the budget
+    - "parallel":   tiled blocks spread over local worker processes
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Tuple
+import numpy as np
+
+from imnfs.model import RNF
+from imnfs.operations import compute_weight, compute_normalized_scores
+from imnfs.operations.entropy_calculator import (
+    entropy_list,
+    cross_entropy_list,
+    entropy_sums,
+    cross_entropy_block_sums,
+)
+from imnfs.operations.histogram_calculator import (
+    GradeHistogram,
+    detect_grade_scale,
+    TILE_ENTRY_BYTES,
+    TILE_ENTRIES,
+)
+from imnfs.operations.ranking_calculator import (
+    weighted_reference_scores,
+    POSITIVE_REFERENCE,
+    NEGATIVE_REFERENCE,
+)
+from imnfs.operations.weight_calculator import weights_from_entropy
+from imnfs.exceptions import InvalidTypeError, DataTypeError
+
+PROFILE_FORMAT_VERSION = 1
+PROFILE_ENV_VAR = "IMNFS_PROFILE"
+DEFAULT_PROFILE_PATH = Path.home() / ".imnfs" / "calibration.json"
+STRATEGIES = ("loop", "graded", "vectorized", "tiled", "parallel")
+
+# Conservative figures used until `imnfs-run calibrate` has been run
+DEFAULT_PROFILE = {
+    "version": PROFILE_FORMAT_VERSION,
+    "loop_pair_seconds": 2e-4,
+    "vectorized_pair_seconds": 5e-8,
+    "tiled_pair_seconds": 6e-8,
+    "process_startup_seconds": 0.5,
+    "cpu_count": os.cpu_count() or 1,
+}
+
+
+def _physical_memory() -> int:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return 4 * 2**30
+
+
+def _available_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# =====================================================================
+# Calibration profile
+# =====================================================================
+
+def profile_path(path: Optional[str] = None) -> Path:
+    """Resolve the calibration profile path (argument, $IMNFS_PROFILE, then default)."""
+    return Path(path or os.environ.get(PROFILE_ENV_VAR) or DEFAULT_PROFILE_PATH)
+
+
+def load_profile(path: Optional[str] = None) -> dict:
+    """Load a calibration profile, falling back to DEFAULT_PROFILE if none exists."""
+    target = profile_path(path)
+    if not target.exists():
+        return dict(DEFAULT_PROFILE)
+    try:
+        with open(target, "r", encoding="utf-8") as f:
+            profile = json.load(f)
+    except json.JSONDecodeError as e:
+        raise DataTypeError(received_type="JSON", message=f"Invalid calibration profile {target}: {e}")
+    if profile.get("version") != PROFILE_FORMAT_VERSION:
+        raise DataTypeError(message=f"Unsupported calibration profile version {profile.get('version')!r}.")
+    return {**DEFAULT_PROFILE, **profile}
+
+
+def save_profile(profile: dict, path: Optional[str] = None) -> Path:
+    """Write a calibration profile as JSON."""
+    target = profile_path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "w", encoding="utf-8") as f:
+        json.dump(profile, f, indent=2)
+    return target
+
+
+def _best_time(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibrate(quick: bool = False, index: int = 4, seed: int = 0) -> dict:
+    """
+    Measure the per-pair cost of every strategy on this machine.
+
+    Args:
+        quick (bool): Use smaller problems (less accurate, a few seconds).
+        index (int): Similarity measure used for timing.
+        seed (int): Seed of the synthetic data.
+
+    Returns:
+        dict: Calibration profile, to be stored with `save_profile`.
+    """
+    from imnfs.distributed import LocalProcessTransport
+
+    rng = np.random.default_rng(seed)
+    repeats = 2 if quick else 3
+
+    n_loop = 12 if quick else 24
+    small = rng.random((2, n_loop, 4))
+    loop = _best_time(lambda: cross_entropy_list(small, index, grade_scale=None), repeats)
+
+    n_vec = 300 if quick else 800
+    data = rng.random((4, n_vec, 4))
+    pairs = 4 * n_vec * n_vec
+    vectorized = _best_time(lambda: cross_entropy_block_sums(data, data, index, tile_size=n_vec), repeats)
+    tiled = _best_time(lambda: cross_entropy_block_sums(data, data, index, tile_size=32), repeats)
+
+    def start_pool():
+        with LocalProcessTransport(max_workers=2) as transport:
+            transport.map([{"kind": "entropy", "shard": 0, "index": index, "data": small}])
+    startup = _best_time(start_pool, 1 if quick else 2)
+
+    return {
+        "version": PROFILE_FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "cpu_count": _available_cores(),
+        "loop_pair_seconds": loop / (2 * n_loop * (n_loop - 1)),
+        "vectorized_pair_seconds": vectorized / pairs,
+        "tiled_pair_seconds": tiled / pairs,
+        "process_startup_seconds": startup,
+    }
+
+
+# =====================================================================
+# Plans
+# =====================================================================
+
+class ExecutionPlan:
+    """
+    Chosen strategy for one RNF tensor, with the estimates that led to it.
+
+    Attributes:
+        strategy (str): One of STRATEGIES
+        tile_size (int): Rows per pairwise tile ("tiled" / "parallel")
+        n_workers (int): Worker processes ("parallel")
+        grade_scale (int): Grade scale ("graded")
+        tile_entries (int): Entries per distinct-tuple tile ("graded")
+        estimates (dict): Estimated seconds per feasible strategy
+        peak_bytes (int): Estimated peak temporary memory of the chosen strategy
+    """
+
+    def __init__(self, strategy: str, tile_size: int = None, n_workers: int = 1,
+                 grade_scale: int = None, tile_entries: int = None, estimates: dict = None,
+                 peak_bytes: int = 0):
+        if strategy not in STRATEGIES:
+            raise InvalidTypeError(var_name="strategy", expected_type=STRATEGIES, received_type=strategy)
+        self.strategy = strategy
+        self.tile_size = tile_size
+        self.n_workers = n_workers
+        self.grade_scale = grade_scale
+        self.tile_entries = tile_entries
+        self.estimates = estimates or {}
+        self.peak_bytes = peak_bytes
+
+    def to_dict(self) -> dict:
+        return {
+            "strategy": self.strategy,
+            "tile_size": self.tile_size,
+            "n_workers": self.n_workers,
+            "grade_scale": self.grade_scale,
+            "tile_entries": self.tile_entries,
+            "estimates": self.estimates,
+            "peak_bytes": self.peak_bytes,
+        }
+
+    def __repr__(self):
+        seconds = self.estimates.get(self.strategy)
+        eta = f", ~{seconds:.3g}s" if seconds is not None else ""
+        return f"ExecutionPlan({self.strategy}, tile_size={self.tile_size}, n_workers={self.n_workers}{eta})"
+
+    # ----------------------------------------------------------------------
+    # Execution
+    # ----------------------------------------------------------------------
+
+    @staticmethod
+    def _store(rnf: RNF):
+        return (rnf.components if rnf.layout == "soa" else rnf.data), rnf.component_axis
+
+    def _histogram(self, rnf: RNF) -> GradeHistogram:
+        return GradeHistogram(rnf.data, self.grade_scale, tile_entries=self.tile_entries or TILE_ENTRIES)
+
+    def _coordinator(self, rnf: RNF):
+        from imnfs.distributed import Coordinator, LocalProcessTransport
+        return Coordinator(rnf, self.n_workers, LocalProcessTransport(self.n_workers))
+
+    def compute_entropies(self, rnf: RNF, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-criterion entropy and cross-entropy with this plan's strategy."""
+        if self.strategy == "loop":
+            return (np.array(entropy_list(rnf.data, index, grade_scale=None)),
+                    np.array(cross_entropy_list(rnf.data, index, grade_scale=None)))
+        if self.strategy == "graded":
+            return self._histogram(rnf).entropies(index)
+        if self.strategy == "parallel":
+            coordinator = self._coordinator(rnf)
+            try:
+                return coordinator.compute_entropies(index)
+            finally:
+                coordinator.transport.close()
+
+        data, axis = self._store(rnf)
+        n = rnf.data.shape[1]
+        tile = n if self.strategy == "vectorized" else self.tile_size
+        entropy = entropy_sums(data, index, component_axis=axis) / n
+        cross = cross_entropy_block_sums(data, data, index, exclude_diagonal=True,
+                                         tile_size=tile, component_axis=axis)
+        return entropy, 1 - cross / (n * (n - 1))
+
+    def compute_weight(self, rnf: RNF, index: int) -> List[float]:
+        """Criteria weights with this plan's strategy (same values as `compute_weight`)."""
+        if self.strategy == "loop":
+            return compute_weight(rnf, index, grade_scale=None)
+        return weights_from_entropy(*self.compute_entropies(rnf, index)).tolist()
+
+    def compute_normalized_scores(self, rnf: RNF, index: int) -> List[float]:
+        """Normalized scores with this plan's strategy (same values as `compute_normalized_scores`)."""
+        if self.strategy == "loop":
+            return compute_normalized_scores(rnf, index, grade_scale=None)
+        if self.strategy == "graded":
+            # One histogram serves the weights and both reference scores
+            histogram = self._histogram(rnf)
+            weights = weights_from_entropy(*histogram.entropies(index))
+            spos = weights @ histogram.reference_similarity(POSITIVE_REFERENCE, index)
+            sneg = weights @ histogram.reference_similarity(NEGATIVE_REFERENCE, index)
+            return (spos / (spos + sneg)).tolist()
+        if self.strategy == "parallel":
+            coordinator = self._coordinator(rnf)
+            try:
+                return coordinator.compute_normalized_scores(index)
+            finally:
+                coordinator.transport.close()
+
+        weights = self.compute_weight(rnf, index)
+        data, axis = self._store(rnf)
+        spos = weighted_reference_scores(data, weights, POSITIVE_REFERENCE, index, axis)
+        sneg = weighted_reference_scores(data, weights, NEGATIVE_REFERENCE, index, axis)
+        return (spos / (spos + sneg)).tolist()
+
+
+class ExecutionPlanner:
+    """
+    Picks an ExecutionPlan from the problem shape and a calibration profile.
+    """
+
+    def __init__(self, profile: Optional[dict] = None, memory_budget: Optional[int] = None,
+                 n_workers: Optional[int] = None, strategy: Optional[str] = None):
+        """
+        Initialize ExecutionPlanner.
+
+        Args:
+            profile (dict, optional): Calibration profile. Defaults to `load_profile()`.
+            memory_budget (int, optional): Bytes available for temporaries. Defaults to 25% of RAM.
+            n_workers (int, optional): Cores available for "parallel". Defaults to the usable CPU count.
+            strategy (str, optional): Force a strategy instead of choosing one.
+        """
+        if strategy is not None and strategy not in STRATEGIES:
+            raise InvalidTypeError(var_name="strategy", expected_type=STRATEGIES, received_type=strategy)
+        self.profile = profile if profile is not None else load_profile()
+        self.memory_budget = memory_budget or _physical_memory() // 4
+        self.n_workers = n_workers or _available_cores()
+        self.strategy = strategy
+
+    def plan(self, rnf: RNF) -> ExecutionPlan:
+        """
+        Estimate every strategy for this RNF and return the fastest feasible plan.
+
+        Args:
+            rnf (RNF): RNF object (contains 3D NF data array)
+
+        Returns:
+            ExecutionPlan: Chosen plan; `estimates` lists all feasible strategies.
+        """
+        if not isinstance(rnf, RNF):
+            raise InvalidTypeError("rnf must be an instance of RNF.")
+
+        criteria, n = rnf.data.shape[0], rnf.data.shape[1]
+        # The pairwise kernels promote to float64
+        itemsize = max(rnf.data.dtype.itemsize, np.dtype(float).itemsize)
+        pairs = criteria * n * max(n - 1, 1)
+        p = self.profile
+
+        # Bytes of the pairwise temporaries for one row of alternatives
+        row_bytes = max(1, criteria * n * 4 * itemsize * 3)
+        tile = int(max(1, min(n, self.memory_budget // row_bytes)))
+        estimates, peaks, options = {}, {}, {}
+
+        estimates["loop"] = pairs * p["loop_pair_seconds"]
+        peaks["loop"] = 0
+
+        scale = detect_grade_scale(rnf.data)
+        if scale is not None:
+            distinct = min(n, (scale + 1) ** 4)
+            # Spend what the histogram itself leaves of the budget on its pairwise tiles
+            spare = self.memory_budget - GradeHistogram.peak_bytes(criteria, n, distinct, tile_entries=0)
+            tile_entries = int(min(TILE_ENTRIES, max(distinct, spare // TILE_ENTRY_BYTES)))
+            peak = GradeHistogram.peak_bytes(criteria, n, distinct, tile_entries)
+            if peak <= self.memory_budget:
+                estimates["graded"] = criteria * (distinct ** 2 + 8 * n) * p["vectorized_pair_seconds"]
+                peaks["graded"] = peak
+                options["tile_entries"] = tile_entries
+            options["grade_scale"] = scale
+
+        if n * row_bytes <= self.memory_budget:
+            estimates["vectorized"] = pairs * p["vectorized_pair_seconds"]
+            peaks["vectorized"] = n * row_bytes
+
+        if row_bytes <= self.memory_budget:
+            estimates["tiled"] = pairs * p["tiled_pair_seconds"]
+            peaks["tiled"] = tile * row_bytes
+
+        # Blocks spread evenly over the workers, each holding its own ~32 MB tile
+        workers = min(self.n_workers, n)
+        worker_peak = workers * min(n * row_bytes, 3 * 32 * 2**20)
+        if workers > 1 and worker_peak <= self.memory_budget:
+            estimates["parallel"] = p["process_startup_seconds"] + pairs * p["tiled_pair_seconds"] / workers
+            peaks["parallel"] = worker_peak
+
+        chosen = self.strategy or min(estimates, key=estimates.get)
+        if chosen not in estimates:
+            raise InvalidTypeError(message=f"Strategy '{chosen}' is not feasible for this problem.")
+        return ExecutionPlan(
+            chosen,
+            tile_size=tile,
+            n_workers=workers if chosen == "parallel" else 1,
+            grade_scale=options.get("grade_scale"),
+            tile_entries=options.get("tile_entries"),
+            estimates=estimates,
+            peak_bytes=peaks[chosen],
+        )
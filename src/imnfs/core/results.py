@@ -0,0 +1,313 @@
+"""
+Columnar results of a decision run across similarity measures.
+
+`evaluate` computes weights, S+, S-, normalized scores and ranks for every
+requested measure into contiguous (measures, ...) arrays. `DecisionResults`
+writes them in bulk to .npz, Parquet or Feather (one row per measure and
+alternative, built from the arrays without per-row Python work), and
+`RunLog` keeps an append-only JSON-lines history keyed by input fingerprint.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+import numpy as np
+
+from imnfs.model import RNF
+from imnfs.operations import compute_weight
+from imnfs.operations.ranking_calculator import (
+    weighted_reference_scores,
+    POSITIVE_REFERENCE,
+    NEGATIVE_REFERENCE,
+)
+from imnfs.exceptions import DataTypeError, EmptyDataError, InvalidIndexError, InvalidTypeError
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def fingerprint(rnf: RNF) -> str:
+    """
+    Stable hash of an RNF input: shape, cost mask and values, independent of the storage layout.
+
+    Returns:
+        str: 32-character hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    data = rnf.data
+    digest.update(json.dumps([list(data.shape), data.dtype.str]).encode())
+    if rnf.cost_mask is not None:
+        digest.update(np.asarray(rnf.cost_mask, dtype=bool).tobytes())
+    # One criterion at a time keeps the temporary small for component-major storage
+    for criterion in data:
+        digest.update(np.ascontiguousarray(criterion).data)
+    return digest.hexdigest()
+
+
+def _arrow():
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet and Feather export require the 'pyarrow' package "
+                          "(install the 'arrow' extra: pip install 'imnfs[arrow]').") from e
+    return pyarrow
+
+
+class DecisionResults:
+    """
+    Weights, S+, S-, normalized scores and ranks for several measures.
+
+    Attributes:
+        measures (np.ndarray): Measure indices, shape (M,)
+        weights (np.ndarray): Criteria weights, shape (M, criteria)
+        spos (np.ndarray): Weighted similarity to the positive ideal, shape (M, alternatives)
+        sneg (np.ndarray): Weighted similarity to the negative ideal, shape (M, alternatives)
+        scores (np.ndarray): S+ / (S+ + S-), shape (M, alternatives)
+        ranks (np.ndarray): Rank of every alternative per measure, 1 = highest score
+        fingerprint (str): Fingerprint of the RNF input
+    """
+
+    COLUMNS = ("measure", "alternative", "s_pos", "s_neg", "score", "rank")
+
+    def __init__(self, measures, weights, spos, sneg, scores, ranks, fingerprint: str = None):
+        self.measures = np.asarray(measures, dtype=np.int64)
+        self.weights = np.ascontiguousarray(weights, dtype=float)
+        self.spos = np.ascontiguousarray(spos, dtype=float)
+        self.sneg = np.ascontiguousarray(sneg, dtype=float)
+        self.scores = np.ascontiguousarray(scores, dtype=float)
+        self.ranks = np.ascontiguousarray(ranks, dtype=np.int64)
+        self.fingerprint = fingerprint
+
+    @property
+    def n_alternatives(self) -> int:
+        return self.scores.shape[1]
+
+    def best(self) -> np.ndarray:
+        """Best alternative (1-based) per measure, as `DecisionMaker.best_alternative`."""
+        return np.argmax(self.scores, axis=1) + 1
+
+    def _row(self, index: int) -> int:
+        hits = np.flatnonzero(self.measures == index)
+        if len(hits) == 0:
+            raise InvalidIndexError(index, message=f"Measure {index} was not evaluated; available: {self.measures.tolist()}.")
+        return int(hits[0])
+
+    def __getitem__(self, index: int) -> Dict[str, np.ndarray]:
+        """Arrays of one measure: weights, spos, sneg, scores, ranks."""
+        row = self._row(index)
+        return {name: getattr(self, name)[row] for name in ("weights", "spos", "sneg", "scores", "ranks")}
+
+    def __repr__(self):
+        return (f"DecisionResults(measures={self.measures.tolist()}, "
+                f"alternatives={self.n_alternatives}, best={self.best().tolist()})")
+
+    # ----------------------------------------------------------------------
+    # Columnar views
+    # ----------------------------------------------------------------------
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Long-format columns, one row per (measure, alternative)."""
+        n = self.n_alternatives
+        return {
+            "measure": np.repeat(self.measures, n),
+            "alternative": np.tile(np.arange(1, n + 1, dtype=np.int64), len(self.measures)),
+            "s_pos": self.spos.reshape(-1),
+            "s_neg": self.sneg.reshape(-1),
+            "score": self.scores.reshape(-1),
+            "rank": self.ranks.reshape(-1),
+        }
+
+    def metadata(self) -> dict:
+        """Run-level values stored beside the table (weights are per criterion, not per row)."""
+        return {
+            "version": RESULTS_FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "measures": self.measures.tolist(),
+            "weights": self.weights.tolist(),
+        }
+
+    def to_frame(self):
+        """Long-format pandas DataFrame (weights in `DataFrame.attrs`)."""
+        import pandas as pd
+        frame = pd.DataFrame(self.columns(), copy=False)
+        frame.attrs.update(self.metadata())
+        return frame
+
+    def to_table(self):
+        """Long-format pyarrow Table, with the run metadata in the schema."""
+        pa = _arrow()
+        table = pa.table(self.columns())
+        return table.replace_schema_metadata({"imnfs": json.dumps(self.metadata())})
+
+    # ----------------------------------------------------------------------
+    # Bulk writers
+    # ----------------------------------------------------------------------
+
+    def to_npz(self, filepath: Union[str, Path]) -> Path:
+        """Write every array (measure-major) to a NumPy .npz file."""
+        filepath = Path(filepath)
+        with open(filepath, "wb") as f:
+            np.savez(
+                f,
+                meta=np.array(json.dumps(self.metadata())),
+                measures=self.measures, weights=self.weights,
+                spos=self.spos, sneg=self.sneg, scores=self.scores, ranks=self.ranks,
+            )
+        return filepath
+
+    def to_parquet(self, filepath: Union[str, Path], compression: str = "snappy") -> Path:
+        """Write the long-format table to Parquet."""
+        pa = _arrow()
+        pa.parquet.write_table(self.to_table(), str(filepath), compression=compression)
+        return Path(filepath)
+
+    def to_feather(self, filepath: Union[str, Path], compression: str = "uncompressed") -> Path:
+        """Write the long-format table to Feather (Arrow IPC)."""
+        pa = _arrow()
+        pa.feather.write_feather(self.to_table(), str(filepath), compression=compression)
+        return Path(filepath)
+
+    def save(self, filepath: Union[str, Path]) -> Path:
+        """Write by extension: .npz, .parquet or .feather."""
+        ext = Path(filepath).suffix.lower()
+        writers = {".npz": self.to_npz, ".parquet": self.to_parquet, ".feather": self.to_feather}
+        if ext not in writers:
+            raise InvalidTypeError(var_name="file extension", expected_type=tuple(writers), received_type=ext)
+        return writers[ext](filepath)
+
+    @classmethod
+    def load(cls, filepath: Union[str, Path]) -> "DecisionResults":
+        """Read results written by `save` in any of its formats."""
+        ext = Path(filepath).suffix.lower()
+        if ext == ".npz":
+            with np.load(filepath, allow_pickle=False) as f:
+                meta = json.loads(str(f["meta"]))
+                cls._check_version(meta)
+                return cls(f["measures"], f["weights"], f["spos"], f["sneg"], f["scores"], f["ranks"],
+                           meta["fingerprint"])
+
+        pa = _arrow()
+        if ext == ".parquet":
+            table = pa.parquet.read_table(str(filepath))
+        elif ext == ".feather":
+            table = pa.feather.read_table(str(filepath))
+        else:
+            raise InvalidTypeError(var_name="file extension", expected_type=(".npz", ".parquet", ".feather"),
+                                   received_type=ext)
+        meta = json.loads(table.schema.metadata[b"imnfs"])
+        cls._check_version(meta)
+        shape = (len(meta["measures"]), -1)
+        col = {name: table.column(name).to_numpy().reshape(shape) for name in cls.COLUMNS[2:]}
+        return cls(meta["measures"], meta["weights"], col["s_pos"], col["s_neg"], col["score"], col["rank"],
+                   meta["fingerprint"])
+
+    @staticmethod
+    def _check_version(meta: dict):
+        if meta.get("version") != RESULTS_FORMAT_VERSION:
+            raise DataTypeError(message=f"Unsupported results format version {meta.get('version')!r}.")
+
+
+def evaluate(
+    rnf: RNF,
+    measures: Iterable[int] = range(9),
+    planner=None,
+    weights: Optional[Dict[int, np.ndarray]] = None,
+) -> DecisionResults:
+    """
+    Compute weights, S+, S-, scores and ranks for several measures at once.
+
+    Args:
+        rnf (RNF): RNF object (contains 3D NF data array)
+        measures (Iterable[int]): Measure indices (0..8)
+        planner (ExecutionPlanner | ExecutionPlan, optional): Strategy for the weights.
+            Defaults to `compute_weight`.
+        weights (dict, optional): Precomputed weights per measure, e.g. from a WarmState
+
+    Returns:
+        DecisionResults: Contiguous (measures, ...) arrays.
+    """
+    from imnfs.core.planner import ExecutionPlanner
+
+    if not isinstance(rnf, RNF):
+        raise InvalidTypeError("rnf must be an instance of RNF.")
+    measures = list(measures)
+    if not measures:
+        raise EmptyDataError("At least one measure must be evaluated.")
+    for k in measures:
+        if not isinstance(k, int) or not 0 <= k < 9:
+            raise InvalidIndexError(k, message=f"Invalid measure index '{k}'. Expected 0..8.")
+
+    plan = planner.plan(rnf) if isinstance(planner, ExecutionPlanner) else planner
+    weights = weights or {}
+    data = rnf.components if rnf.layout == "soa" else rnf.data
+    axis = rnf.component_axis
+    n_criteria, n = rnf.data.shape[0], rnf.data.shape[1]
+
+    w = np.empty((len(measures), n_criteria))
+    spos = np.empty((len(measures), n))
+    sneg = np.empty((len(measures), n))
+    for row, k in enumerate(measures):
+        if k in weights:
+            w[row] = weights[k]
+        else:
+            w[row] = plan.compute_weight(rnf, k) if plan is not None else compute_weight(rnf, k)
+        spos[row] = weighted_reference_scores(data, w[row], POSITIVE_REFERENCE, k, axis)
+        sneg[row] = weighted_reference_scores(data, w[row], NEGATIVE_REFERENCE, k, axis)
+
+    scores = spos / (spos + sneg)
+    ranks = np.empty(scores.shape, dtype=np.int64)
+    order = np.argsort(-scores, axis=1, kind="stable")
+    np.put_along_axis(ranks, order, np.arange(1, n + 1), axis=1)
+    return DecisionResults(measures, w, spos, sneg, scores, ranks, fingerprint(rnf))
+
+
+class RunLog:
+    """
+    Append-only JSON-lines log of decision runs, keyed by input fingerprint.
+
+    Each record holds the fingerprint, UTC time, input shape, measures,
+    weights, best alternatives and an optional path to the bulk results file.
+    Records are only ever appended, one line per run.
+    """
+
+    def __init__(self, filepath: Union[str, Path]):
+        self.filepath = Path(filepath)
+
+    def append(self, results: DecisionResults, artifact: Optional[Union[str, Path]] = None, **extra) -> dict:
+        """Append one run; extra keyword values must be JSON-serializable."""
+        record = {
+            "fingerprint": results.fingerprint,
+            "time": datetime.now(timezone.utc).isoformat(timespec="microseconds"),
+            "alternatives": results.n_alternatives,
+            "measures": results.measures.tolist(),
+            "weights": results.weights.tolist(),
+            "best": results.best().tolist(),
+            "artifact": None if artifact is None else str(artifact),
+            **extra,
+        }
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.filepath, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        return record
+
+    def entries(self, fingerprint: Optional[str] = None) -> List[dict]:
+        """All records, or those of one input fingerprint, oldest first."""
+        if not self.filepath.exists():
+            return []
+        out = []
+        with open(self.filepath, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if fingerprint is None or record["fingerprint"] == fingerprint:
+                    out.append(record)
+        return out
+
+    def latest(self, fingerprint: str) -> Optional[dict]:
+        """Most recent record of an input fingerprint, or None."""
+        records = self.entries(fingerprint)
+        return records[-1] if records else None
@@ -0,0 +1,3 @@
+from .generator import NFWorkloadGenerator, generate_nf_tensor
+
+__all__ = ["NFWorkloadGenerator", "generate_nf_tensor"]
@@ -0,0 +1,169 @@
+from typing import List, Optional, Tuple
+import numpy as np
+
+from imnfs.exceptions import InvalidTypeError
+
+
+class NFWorkloadGenerator:
+    """
+    Reproducible synthetic NF decision tensors of shape (criteria, alternatives, 4).
+
+    Values are drawn directly in NumPy, criterion by criterion, so the
+    generator scales to millions of alternatives. Criteria can be correlated,
+    values can be snapped to a grade scale and a fraction of the criteria
+    can be marked as cost criteria for `RNF`.
+    """
+
+    DISTRIBUTIONS = ("uniform", "beta", "normal")
+
+    def __init__(
+        self,
+        n_criteria: int,
+        n_alternatives: int,
+        distribution: str = "uniform",
+        low: float = 0.0,
+        high: float = 1.0,
+        levels: Optional[int] = None,
+        correlation: float = 0.0,
+        cost_fraction: float = 0.0,
+        seed: Optional[int] = None,
+        dtype=np.float64,
+        alpha: float = 2.0,
+        beta: float = 2.0,
+        mean: float = 0.5,
+        std: float = 0.2,
+    ):
+        """
+        Initialize NFWorkloadGenerator.
+
+        Args:
+            n_criteria (int): Number of criteria (first axis)
+            n_alternatives (int): Number of alternatives (second axis)
+            distribution (str): "uniform", "beta" (alpha, beta) or "normal" (mean, std, clipped)
+            low (float): Smallest value
+            high (float): Largest value
+            levels (int, optional): Grade scale; values are multiples of 1/levels
+                (levels=10, low=0.1, high=0.9 reproduces the 0.1..0.9 demo grid)
+            correlation (float): Correlation between criteria, in [0, 1]
+            cost_fraction (float): Fraction of criteria marked as cost criteria
+            seed (int, optional): Seed of the random generator
+            dtype: Floating dtype of the tensor
+            alpha, beta (float): Shape parameters of the beta distribution
+            mean, std (float): Parameters of the normal distribution
+        """
+        if not isinstance(n_criteria, int) or not isinstance(n_alternatives, int) \
+                or n_criteria < 1 or n_alternatives < 1:
+            raise InvalidTypeError(message="n_criteria and n_alternatives must be positive integers.")
+        if distribution not in self.DISTRIBUTIONS:
+            raise InvalidTypeError(
+                var_name="distribution", expected_type=self.DISTRIBUTIONS, received_type=distribution
+            )
+        if not 0.0 <= low <= high <= 1.0:
+            raise InvalidTypeError(message="low and high must satisfy 0 <= low <= high <= 1.")
+        if levels is not None and (not isinstance(levels, int) or levels < 1):
+            raise InvalidTypeError(message="levels must be a positive integer.")
+        if levels is not None and np.ceil(low * levels - 1e-9) > np.floor(high * levels + 1e-9):
+            raise InvalidTypeError(message=f"No multiple of 1/{levels} lies in [{low}, {high}].")
+        if not 0.0 <= correlation <= 1.0:
+            raise InvalidTypeError(message="correlation must be in [0, 1].")
+        if not 0.0 <= cost_fraction <= 1.0:
+            raise InvalidTypeError(message="cost_fraction must be in [0, 1].")
+
+        self.n_criteria = n_criteria
+        self.n_alternatives = n_alternatives
+        self.distribution = distribution
+        self.low = low
+        self.high = high
+        self.levels = levels
+        self.correlation = correlation
+        self.cost_fraction = cost_fraction
+        self.seed = seed
+        self.dtype = dtype
+        self.alpha = alpha
+        self.beta = beta
+        self.mean = mean
+        self.std = std
+
+    # --------------------------------------------------
+    # Sampling
+    # --------------------------------------------------
+
+    def _draw(self, rng: np.random.Generator, shape) -> np.ndarray:
+        """Draw values with the configured marginal distribution."""
+        if self.distribution == "uniform" and self.levels is not None:
+            # Exact discrete uniform over the grid points in [low, high]
+            lo = int(np.ceil(self.low * self.levels - 1e-9))
+            hi = int(np.floor(self.high * self.levels + 1e-9))
+            return rng.integers(lo, hi + 1, size=shape).astype(self.dtype) / self.levels
+
+        if self.distribution == "uniform":
+            out = rng.random(size=shape, dtype=np.float64)
+            out *= self.high - self.low
+            out += self.low
+        elif self.distribution == "beta":
+            out = rng.beta(self.alpha, self.beta, size=shape)
+            out *= self.high - self.low
+            out += self.low
+        else:
+            out = rng.normal(self.mean, self.std, size=shape)
+            np.clip(out, self.low, self.high, out=out)
+
+        if self.levels is not None:
+            out = np.round(out * self.levels)
+            np.clip(out, np.ceil(self.low * self.levels - 1e-9), np.floor(self.high * self.levels + 1e-9), out=out)
+            out += 0.0  # turn -0.0 from rounding into 0.0
+            out /= self.levels
+        return out.astype(self.dtype, copy=False)
+
+    def generate(self) -> Tuple[np.ndarray, List[int]]:
+        """
+        Generate the NF tensor and its cost criteria.
+
+        Returns:
+            Tuple[np.ndarray, List[int]]: Tensor (criteria, alternatives, 4) and
+            sorted list of cost criterion indices, ready for `NFSet` / `RNF`.
+        """
+        rng = np.random.default_rng(self.seed)
+        shape = (self.n_alternatives, 4)
+        out = np.empty((self.n_criteria,) + shape, dtype=self.dtype)
+
+        # Each criterion takes a shared draw with probability sqrt(rho): every
+        # marginal stays intact and two criteria correlate with exactly rho
+        shared = self._draw(rng, shape) if self.correlation > 0 else None
+        p_shared = np.sqrt(self.correlation)
+        for c in range(self.n_criteria):
+            out[c] = self._draw(rng, shape)
+            if shared is not None:
+                mask = rng.random(size=shape) < p_shared
+                np.copyto(out[c], shared, where=mask)
+
+        n_cost = int(round(self.cost_fraction * self.n_criteria))
+        cost = sorted(int(i) for i in rng.choice(self.n_criteria, size=n_cost, replace=False))
+        return out, cost
+
+    def save(self, filepath: str) -> List[int]:
+        """
+        Generate the tensor and write it in any format read by `load_data`.
+
+        Returns:
+            List[int]: The cost criterion indices.
+        """
+        from imnfs.io import save_data
+
+        data, cost = self.generate()
+        save_data(data, filepath)
+        return cost
+
+
+# =====================================================================
+# Helper function (shortcut)
+# =====================================================================
+
+def generate_nf_tensor(n_criteria: int, n_alternatives: int, **kwargs) -> Tuple[np.ndarray, List[int]]:
+    """
+    Quick utility wrapper around NFWorkloadGenerator.generate.
+
+    Example:
+        >>> data, cost = generate_nf_tensor(5, 1_000_000, levels=10, low=0.1, high=0.9, seed=7)
+    """
+    return NFWorkloadGenerator(n_criteria, n_alternatives, **kwargs).generate()
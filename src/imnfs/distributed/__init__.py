@@ -0,0 +1,18 @@
+from .coordinator import Coordinator
+from .transport import InlineTransport, LocalProcessTransport
+from .worker import run_task
+from .partials import EntropyPartial, CrossEntropyPartial, ScorePartial
+from .warmstart import WarmState, export_state, attach_state
+
+__all__ = [
+    "Coordinator",
+    "InlineTransport",
+    "LocalProcessTransport",
+    "run_task",
+    "EntropyPartial",
+    "CrossEntropyPartial",
+    "ScorePartial",
+    "WarmState",
+    "export_state",
+    "attach_state",
+]
@@ -0,0 +1,186 @@
+from collections import Counter
+from typing import List, Tuple
+import numpy as np
+
+from imnfs.model import RNF
+from imnfs.operations.weight_calculator import weights_from_entropy
+from imnfs.exceptions import (
+    InvalidTypeError,
+    InvalidIndexError,
+    PartialStateError,
+    WeightComputationError,
+)
+from .partials import from_dict
+from .transport import InlineTransport
+
+
+class Coordinator:
+    """
+    Coordinator of sharded NF scoring.
+
+    Splits the alternatives of an RNF tensor into contiguous shards, sends
+    entropy, cross-entropy and scoring tasks to workers through a transport,
+    and merges the returned partials into the same weights and normalized
+    scores as `compute_weight` / `compute_normalized_scores`.
+    """
+
+    def __init__(self, rnf: RNF, n_shards: int, transport=None):
+        """
+        Initialize Coordinator.
+
+        Args:
+            rnf (RNF): RNF object (contains 3D NF data array)
+            n_shards (int): Number of alternative shards (capped at the number of alternatives)
+            transport (optional): Object with a `map(tasks)` method. Defaults to InlineTransport.
+        """
+        if not isinstance(rnf, RNF):
+            raise InvalidTypeError("rnf must be an instance of RNF.")
+        if not isinstance(n_shards, int) or n_shards < 1:
+            raise InvalidTypeError(message="n_shards must be a positive integer.")
+
+        # Shards keep the RNF's storage layout so workers run contiguous kernels
+        self.data = rnf.components if rnf.layout == "soa" else rnf.data
+        self.component_axis = rnf.component_axis
+        self.n_criteria, self.n_alternatives = rnf.data.shape[0], rnf.data.shape[1]
+        self.transport = transport or InlineTransport()
+
+        n = self.n_alternatives
+        bounds = np.linspace(0, n, min(n_shards, n) + 1).round().astype(int)
+        self.shards = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+        self._weights = {}
+        self._entropies = {}
+
+    # ----------------------------------------------------------------------
+    # Task construction
+    # ----------------------------------------------------------------------
+
+    def _shard(self, p: int) -> np.ndarray:
+        start, stop = self.shards[p]
+        if self.component_axis == 0:
+            return self.data[:, :, start:stop]
+        return self.data[:, start:stop]
+
+    def weight_tasks(self, index: int) -> List[dict]:
+        """Build the entropy and cross-entropy tasks for one measure."""
+        tasks = [
+            {"kind": "entropy", "shard": p, "index": index, "data": self._shard(p),
+             "component_axis": self.component_axis}
+            for p in range(len(self.shards))
+        ]
+        for p in range(len(self.shards)):
+            for q in range(p, len(self.shards)):
+                tasks.append({
+                    "kind": "cross_entropy",
+                    "blocks": (p, q),
+                    "index": index,
+                    "x": self._shard(p),
+                    "y": None if p == q else self._shard(q),
+                    "component_axis": self.component_axis,
+                })
+        return tasks
+
+    def score_tasks(self, index: int, weights) -> List[dict]:
+        """Build the scoring tasks for one measure given merged weights."""
+        weights = np.asarray(weights, dtype=float)
+        return [
+            {"kind": "score", "shard": p, "start": start, "index": index,
+             "data": self._shard(p), "weights": weights, "component_axis": self.component_axis}
+            for p, (start, _) in enumerate(self.shards)
+        ]
+
+    # ----------------------------------------------------------------------
+    # Merging
+    # ----------------------------------------------------------------------
+
+    def merge_entropies(self, payloads: List[dict], index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Merge entropy and cross-entropy partials into per-criterion entropy and cross-entropy."""
+        n = self.n_alternatives
+        n_shards = len(self.shards)
+        entropy_total = np.zeros(self.n_criteria)
+        cross_total = np.zeros(self.n_criteria)
+        # Count every shard and block so retried or duplicated partials are caught
+        shards_seen, blocks_seen, count, pairs = Counter(), Counter(), 0, 0
+
+        for partial in map(from_dict, payloads):
+            if partial.index != index:
+                raise PartialStateError(f"Partial for measure {partial.index} merged into measure {index}.")
+            if partial.kind == "entropy":
+                shards_seen[partial.shard] += 1
+                count += partial.count
+                entropy_total += partial.sums
+            elif partial.kind == "cross_entropy":
+                blocks_seen[partial.blocks] += 1
+                cross_total += partial.sums
+                pairs += partial.pairs
+
+        expected_blocks = {(p, q) for p in range(n_shards) for q in range(p, n_shards)}
+        duplicated = [f"shard {p}" for p, c in sorted(shards_seen.items()) if c > 1] \
+            + [f"block {b}" for b, c in sorted(blocks_seen.items()) if c > 1]
+        if duplicated:
+            raise PartialStateError(f"Duplicated partials ({', '.join(duplicated)}); cannot merge weights.")
+        if set(shards_seen) != set(range(n_shards)) or set(blocks_seen) != expected_blocks \
+                or count != n or pairs != n * (n - 1):
+            raise PartialStateError("Missing or unexpected partials; cannot merge weights.")
+
+        return entropy_total / n, 1 - cross_total / pairs
+
+    def merge_weights(self, payloads: List[dict], index: int) -> np.ndarray:
+        """Merge entropy and cross-entropy partials into normalized weights."""
+        weights = weights_from_entropy(*self.merge_entropies(payloads, index))
+        if not np.all(np.isfinite(weights)):
+            raise WeightComputationError()
+        return weights
+
+    def merge_scores(self, payloads: List[dict], index: int) -> np.ndarray:
+        """Merge per-shard S+ / S- partials into normalized scores."""
+        n = self.n_alternatives
+        spos = np.empty(n)
+        sneg = np.empty(n)
+        covered = np.zeros(n, dtype=np.int64)
+        for partial in map(from_dict, payloads):
+            if partial.kind != "score" or partial.index != index:
+                raise PartialStateError("Unexpected partial while merging scores.")
+            stop = partial.start + len(partial.spos)
+            if partial.start < 0 or stop > n or len(partial.sneg) != len(partial.spos):
+                raise PartialStateError(f"Score partial of shard {partial.shard} is outside 0..{n}.")
+            spos[partial.start:stop] = partial.spos
+            sneg[partial.start:stop] = partial.sneg
+            covered[partial.start:stop] += 1
+        if (covered > 1).any():
+            raise PartialStateError(f"Overlapping score partials at alternative {int(np.argmax(covered > 1))}; "
+                                    "cannot merge scores.")
+        if (covered == 0).any():
+            raise PartialStateError("Missing score partials; cannot merge scores.")
+        return spos / (spos + sneg)
+
+    # ----------------------------------------------------------------------
+    # Public API (mirrors imnfs.operations)
+    # ----------------------------------------------------------------------
+
+    def compute_entropies(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Sharded per-criterion entropy and cross-entropy (as `entropy_list` / `cross_entropy_list`)."""
+        self._check_index(index)
+        if index not in self._entropies:
+            payloads = self.transport.map(self.weight_tasks(index))
+            self._entropies[index] = self.merge_entropies(payloads, index)
+        return self._entropies[index]
+
+    def compute_weight(self, index: int) -> List[float]:
+        """Sharded equivalent of `imnfs.operations.compute_weight`."""
+        if index not in self._weights:
+            weights = weights_from_entropy(*self.compute_entropies(index))
+            if not np.all(np.isfinite(weights)):
+                raise WeightComputationError()
+            self._weights[index] = weights
+        return self._weights[index].tolist()
+
+    def compute_normalized_scores(self, index: int) -> List[float]:
+        """Sharded equivalent of `imnfs.operations.compute_normalized_scores`."""
+        weights = self.compute_weight(index)
+        payloads = self.transport.map(self.score_tasks(index, weights))
+        return self.merge_scores(payloads, index).tolist()
+
+    @staticmethod
+    def _check_index(index: int):
+        if not isinstance(index, int) or not 0 <= index < 9:
+            raise InvalidIndexError(index, message=f"Invalid measure index '{index}'. Expected 0..8.")
@@ -0,0 +1,144 @@
+"""
+Serializable partial aggregates exchanged between workers and the coordinator.
+
+Every partial converts to a plain dictionary of JSON types (`to_dict`) and
+back (`from_dict`), so the same payload can travel over pipes, sockets or
+message queues. Floats survive a JSON round-trip exactly.
+"""
+
+import json
+from typing import List
+import numpy as np
+
+from imnfs.exceptions import PartialStateError
+
+PARTIAL_FORMAT_VERSION = 1
+
+
+class EntropyPartial:
+    """Per-criterion sums of similarity(x, 1 - x) over one shard of alternatives."""
+
+    kind = "entropy"
+
+    def __init__(self, shard: int, index: int, count: int, sums):
+        self.shard = shard
+        self.index = index
+        self.count = count
+        self.sums = np.asarray(sums, dtype=float)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": PARTIAL_FORMAT_VERSION,
+            "kind": self.kind,
+            "shard": self.shard,
+            "index": self.index,
+            "count": self.count,
+            "sums": self.sums.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "EntropyPartial":
+        _check_header(payload, cls.kind)
+        return cls(payload["shard"], payload["index"], payload["count"], payload["sums"])
+
+
+class CrossEntropyPartial:
+    """
+    Per-criterion similarity sums over the pairs of one block of shards.
+
+    `blocks` is (p, q) with p <= q. Off-diagonal blocks are computed once and
+    stand for both (p, q) and (q, p), since every measure is symmetric.
+    """
+
+    kind = "cross_entropy"
+
+    def __init__(self, blocks: tuple, index: int, pairs: int, sums):
+        self.blocks = tuple(blocks)
+        self.index = index
+        self.pairs = pairs
+        self.sums = np.asarray(sums, dtype=float)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": PARTIAL_FORMAT_VERSION,
+            "kind": self.kind,
+            "blocks": list(self.blocks),
+            "index": self.index,
+            "pairs": self.pairs,
+            "sums": self.sums.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "CrossEntropyPartial":
+        _check_header(payload, cls.kind)
+        return cls(payload["blocks"], payload["index"], payload["pairs"], payload["sums"])
+
+
+class ScorePartial:
+    """Weighted S+ and S- for the alternatives of one shard."""
+
+    kind = "score"
+
+    def __init__(self, shard: int, index: int, start: int, spos, sneg):
+        self.shard = shard
+        self.index = index
+        self.start = start
+        self.spos = np.asarray(spos, dtype=float)
+        self.sneg = np.asarray(sneg, dtype=float)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": PARTIAL_FORMAT_VERSION,
+            "kind": self.kind,
+            "shard": self.shard,
+            "index": self.index,
+            "start": self.start,
+            "spos": self.spos.tolist(),
+            "sneg": self.sneg.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "ScorePartial":
+        _check_header(payload, cls.kind)
+        return cls(payload["shard"], payload["index"], payload["start"],
+                   payload["spos"], payload["sneg"])
+
+
+PARTIAL_TYPES = {cls.kind: cls for cls in (EntropyPartial, CrossEntropyPartial, ScorePartial)}
+
+
+# =====================================================================
+# Encoding helpers
+# =====================================================================
+
+def _check_header(payload: dict, kind: str):
+    if not isinstance(payload, dict):
+        raise PartialStateError(f"Partial payload must be a dict, got {type(payload).__name__}.")
+    if payload.get("version") != PARTIAL_FORMAT_VERSION:
+        raise PartialStateError(
+            f"Unsupported partial format version {payload.get('version')!r}, "
+            f"expected {PARTIAL_FORMAT_VERSION}."
+        )
+    if payload.get("kind") != kind:
+        raise PartialStateError(f"Expected a '{kind}' partial, got {payload.get('kind')!r}.")
+
+
+def from_dict(payload: dict):
+    """Rebuild any partial from its dictionary form."""
+    if not isinstance(payload, dict) or payload.get("kind") not in PARTIAL_TYPES:
+        raise PartialStateError(f"Unknown partial payload: {payload!r:.80}")
+    return PARTIAL_TYPES[payload["kind"]].from_dict(payload)
+
+
+def dumps(partials: List) -> str:
+    """Encode a list of partials as a JSON string."""
+    return json.dumps([p.to_dict() for p in partials])
+
+
+def loads(text: str) -> List:
+    """Decode a JSON string produced by `dumps`."""
+    try:
+        payloads = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise PartialStateError(f"Invalid partial payload: {e}")
+    return [from_dict(p) for p in payloads]
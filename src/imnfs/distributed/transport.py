@@ -0,0 +1,59 @@
+"""
+Transports deliver task messages to workers and collect their partial states.
+
+Any object with a `map(tasks) -> list[dict]` method can act as a transport;
+results must be returned in task order. Remote transports only need to move
+the task dictionaries to a node running `run_task` and bring back its output.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+import multiprocessing
+
+from .worker import run_task
+
+
+class InlineTransport:
+    """Runs every task in the calling process (single-node reference)."""
+
+    def map(self, tasks: List[dict]) -> List[dict]:
+        return [run_task(task) for task in tasks]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class LocalProcessTransport:
+    """
+    Runs tasks on a pool of local worker processes.
+
+    Stands in for a multi-node deployment: every task and every partial
+    crosses a process boundary, exactly as it would cross the network.
+    """
+
+    def __init__(self, max_workers: int = None, start_method: str = None):
+        """
+        Args:
+            max_workers (int, optional): Number of worker processes. Defaults to the CPU count.
+            start_method (str, optional): multiprocessing start method ("fork", "spawn", ...).
+        """
+        context = multiprocessing.get_context(start_method) if start_method else None
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+    def map(self, tasks: List[dict]) -> List[dict]:
+        return list(self._executor.map(run_task, tasks))
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
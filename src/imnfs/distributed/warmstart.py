@@ -0,0 +1,312 @@
+"""
+Warm-start handoff of DecisionMaker state between processes.
+
+`export_state` writes the RNF tensor, its cost mask and the per-measure
+entropy, cross-entropy and weights into one buffer - named shared memory
+or a file - and `attach_state` maps it back read-only, without copying, so
+a freshly started worker can rank alternatives without re-loading the data
+or recomputing weights.
+
+Buffer layout:
+    8 bytes   magic (WARMSTART_MAGIC)
+    8 bytes   header length (little-endian uint64)
+    n bytes   JSON header: version, layout, measures, {array: [offset, shape, dtype]}
+    arrays    each starting on a 64-byte boundary
+"""
+
+import json
+import mmap
+import os
+import sys
+import tempfile
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+import numpy as np
+
+from imnfs.model import RNF
+from imnfs.exceptions import (
+    DataTypeError,
+    EmptyDataError,
+    InvalidIndexError,
+    InvalidTypeError,
+    WeightComputationError,
+)
+
+WARMSTART_MAGIC = b"IMNFSWS\x00"
+WARMSTART_FORMAT_VERSION = 1
+_ALIGN = 64
+_PREFIX = 16
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+class _SharedBlock(shared_memory.SharedMemory):
+    """SharedMemory whose mapping may outlive it while NumPy views still use it."""
+
+    def __del__(self):
+        try:
+            self.close()
+        except BufferError:
+            # The mapping is released once the last view is gone
+            pass
+
+
+class WarmState:
+    """
+    Read-only view of an exported DecisionMaker state.
+
+    Arrays are views on the shared buffer: `rnf`, `weights(i)`, `entropy(i)`
+    and `cross_entropy(i)` never copy. Create one with `export_state`
+    (owner) or `attach_state` (workers).
+    """
+
+    def __init__(self, buffer, header: dict, handle=None, owner: bool = False):
+        self.header = header
+        self.measures = list(header["measures"])
+        self._handle = handle
+        self._owner = owner
+        self._name = handle.name if isinstance(handle, shared_memory.SharedMemory) else None
+        self._arrays: Dict[str, np.ndarray] = {}
+        # Views of a read-only buffer cannot be made writeable again, so no
+        # process can change the shared state behind the others' backs
+        view = memoryview(buffer).toreadonly()
+        for name, (offset, shape, dtype) in header["arrays"].items():
+            count = int(np.prod(shape))
+            self._arrays[name] = np.frombuffer(view, dtype=np.dtype(dtype), count=count, offset=offset).reshape(shape)
+        self.rnf = RNF._from_store(self._arrays["store"], header["layout"], self._arrays["cost_mask"])
+
+    # ----------------------------------------------------------------------
+    # Access
+    # ----------------------------------------------------------------------
+
+    @property
+    def name(self) -> Optional[str]:
+        """Shared memory name (None for file-backed state)."""
+        return self._name
+
+    @property
+    def cost_mask(self) -> np.ndarray:
+        return self._arrays["cost_mask"]
+
+    def _row(self, array: str, index: int) -> np.ndarray:
+        if index not in self.measures:
+            raise InvalidIndexError(index, message=f"Measure {index} was not exported; available: {self.measures}.")
+        return self._arrays[array][self.measures.index(index)]
+
+    def weights(self, index: int) -> np.ndarray:
+        """Criteria weights of measure `index`."""
+        return self._row("weights", index)
+
+    def entropy(self, index: int) -> np.ndarray:
+        """Per-criterion entropy of measure `index`."""
+        return self._row("entropy", index)
+
+    def cross_entropy(self, index: int) -> np.ndarray:
+        """Per-criterion cross-entropy of measure `index`."""
+        return self._row("cross_entropy", index)
+
+    def decision_maker(self, index: int):
+        """DecisionMaker over the shared RNF, using the exported weights of measure `index`."""
+        from imnfs.core import DecisionMaker
+        return DecisionMaker(self.rnf, index, weights=self.weights(index))
+
+    # ----------------------------------------------------------------------
+    # Lifetime
+    # ----------------------------------------------------------------------
+
+    def close(self):
+        """Release this process's mapping. Views handed out before must no longer be used."""
+        self._arrays = {}
+        self.rnf = None
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except BufferError:
+                # Views are still referenced elsewhere; the mapping goes away with them
+                pass
+            self._handle = None
+
+    def unlink(self):
+        """Remove the shared memory block (owner only; attached workers keep their mappings)."""
+        if self._name is None:
+            return
+        handle = self._handle if self._handle is not None else _SharedBlock(name=self._name)
+        handle.unlink()
+
+    def __enter__(self) -> "WarmState":
+        return self
+
+    def __exit__(self, *exc):
+        if self._owner:
+            self.unlink()
+        self.close()
+
+    def __repr__(self):
+        where = self.name or self.header.get("path")
+        return f"WarmState({where}, shape={self.rnf.data.shape if self.rnf else None}, measures={self.measures})"
+
+
+def _state_arrays(source, measures: Iterable[int], planner=None) -> Tuple[str, Dict[str, np.ndarray]]:
+    """Storage layout and arrays to export for an RNF or DecisionMaker."""
+    from imnfs.core import DecisionMaker
+    from imnfs.operations.entropy_calculator import entropy_list, cross_entropy_list
+    from imnfs.operations.weight_calculator import weights_from_entropy
+
+    plan = None
+    if isinstance(source, DecisionMaker):
+        plan = source.plan
+        source = source.rnf
+    if not isinstance(source, RNF):
+        raise InvalidTypeError(message="source must be an RNF or a DecisionMaker.")
+    if planner is not None:
+        plan = planner.plan(source)
+
+    entropies, crosses = [], []
+    for k in measures:
+        if not isinstance(k, int) or not 0 <= k < 9:
+            raise InvalidIndexError(k, message=f"Invalid measure index '{k}'. Expected 0..8.")
+        if plan is not None:
+            entropy, cross = plan.compute_entropies(source, k)
+        else:
+            entropy, cross = entropy_list(source.data, k), cross_entropy_list(source.data, k)
+        entropies.append(entropy)
+        crosses.append(cross)
+
+    entropy = np.array(entropies, dtype=float).reshape(len(entropies), -1)
+    cross = np.array(crosses, dtype=float).reshape(len(crosses), -1)
+    weights = np.array([weights_from_entropy(e, c) for e, c in zip(entropy, cross)]).reshape(entropy.shape)
+    if not np.all(np.isfinite(weights)):
+        raise WeightComputationError()
+    return source.layout, {
+        "store": np.ascontiguousarray(source._store),
+        "cost_mask": np.asarray(source.cost_mask, dtype=bool),
+        "entropy": entropy,
+        "cross_entropy": cross,
+        "weights": weights,
+    }
+
+
+def export_state(
+    source,
+    path: Optional[Union[str, Path]] = None,
+    name: Optional[str] = None,
+    measures: Iterable[int] = range(9),
+    planner=None,
+) -> WarmState:
+    """
+    Export a DecisionMaker's state for zero-copy warm starts.
+
+    Writes to the file `path` (any mmap-able path, e.g. under /dev/shm), or
+    else to a new named shared memory block (`name`, or a generated one).
+    Files are written under a temporary name and renamed into place, so
+    workers attach either to the previous state or to the complete new one.
+
+    Args:
+        source (RNF | DecisionMaker): State to export; a DecisionMaker's plan is reused
+        path (str | Path, optional): Target file
+        name (str, optional): Shared memory name (ignored when `path` is given)
+        measures (Iterable[int]): Measures whose entropies and weights are precomputed
+        planner (ExecutionPlanner, optional): Strategy for the precomputation
+
+    Returns:
+        WarmState: Owner view of the exported state. For shared memory, the
+        owner keeps the block alive and should `unlink()` it when done.
+    """
+    measures = list(measures)
+    if not measures:
+        raise EmptyDataError("At least one measure must be exported.")
+    layout, arrays = _state_arrays(source, measures, planner)
+
+    def header_for(data_start: int) -> dict:
+        table, offset = {}, data_start
+        for key, arr in arrays.items():
+            offset = _aligned(offset)
+            table[key] = [offset, list(arr.shape), arr.dtype.str]
+            offset += arr.nbytes
+        return {"version": WARMSTART_FORMAT_VERSION, "layout": layout, "measures": measures,
+                "arrays": table, "size": offset}
+
+    # The header's own length shifts the data: grow the data offset until the
+    # encoded header fits in front of it (offsets only grow, so this settles)
+    data_start = _PREFIX
+    while True:
+        header = header_for(data_start)
+        blob = json.dumps(header).encode()
+        if _PREFIX + len(blob) <= data_start:
+            break
+        data_start = _aligned(_PREFIX + len(blob))
+    size = header["size"]
+
+    def write(buf):
+        buf[8:16] = len(blob).to_bytes(8, "little")
+        buf[_PREFIX:_PREFIX + len(blob)] = blob
+        for key, arr in arrays.items():
+            offset = header["arrays"][key][0]
+            np.frombuffer(buf, dtype=arr.dtype, count=arr.size, offset=offset)[:] = arr.reshape(-1)
+        # The magic goes in last: a buffer is only recognized once complete
+        buf[:8] = WARMSTART_MAGIC
+
+    if path is not None:
+        # Write next to the target and rename, so workers never attach to a partial file
+        path = Path(path)
+        fd, tmp = tempfile.mkstemp(prefix=".imnfs-warmstart-", suffix=".tmp", dir=path.parent)
+        try:
+            with open(fd, "r+b") as f:
+                f.truncate(size)
+                with mmap.mmap(f.fileno(), size) as mm:
+                    write(mm)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return attach_state(path=path)
+
+    shm = _SharedBlock(name=name, create=True, size=size)
+    write(shm.buf)
+    return WarmState(shm.buf, header, handle=shm, owner=True)
+
+
+def _read_header(buffer) -> dict:
+    if bytes(buffer[:8]) != WARMSTART_MAGIC:
+        raise DataTypeError(message="Not an IMNFS warm-start buffer.")
+    length = int.from_bytes(bytes(buffer[8:16]), "little")
+    header = json.loads(bytes(buffer[_PREFIX:_PREFIX + length]))
+    if header.get("version") != WARMSTART_FORMAT_VERSION:
+        raise DataTypeError(message=f"Unsupported warm-start format version {header.get('version')!r}.")
+    return header
+
+
+def attach_state(path: Optional[Union[str, Path]] = None, name: Optional[str] = None) -> WarmState:
+    """
+    Attach read-only, without copying, to state written by `export_state`.
+
+    Args:
+        path (str | Path, optional): File written by `export_state`
+        name (str, optional): Shared memory name
+
+    Returns:
+        WarmState: Read-only view; call `close()` when the worker is done.
+
+    Note:
+        Shared memory attached from processes forked or spawned by the
+        exporter is tracked by the exporter's resource tracker. Unrelated
+        processes should prefer a file (e.g. under /dev/shm) on Python < 3.13,
+        where attaching also registers the block for cleanup at their exit.
+    """
+    if path is not None:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = _read_header(mm)
+        header["path"] = str(path)
+        return WarmState(mm, header, handle=mm)
+    if name is None:
+        raise EmptyDataError("attach_state needs a path or a shared memory name.")
+
+    if sys.version_info >= (3, 13):
+        shm = _SharedBlock(name=name, track=False)
+    else:
+        shm = _SharedBlock(name=name)
+    return WarmState(shm.buf, _read_header(shm.buf), handle=shm)
@@ -0,0 +1,79 @@
+"""
+Worker side of the sharded scoring protocol.
+
+A task is a plain dictionary with a `kind` key and the shard arrays it needs;
+`run_task` executes it and returns the dictionary form of a partial, so the
+result can be shipped back to the coordinator by any transport.
+"""
+
+import numpy as np
+
+from imnfs.operations.entropy_calculator import entropy_sums, cross_entropy_block_sums
+from imnfs.operations.ranking_calculator import (
+    weighted_reference_scores,
+    POSITIVE_REFERENCE,
+    NEGATIVE_REFERENCE,
+)
+from imnfs.exceptions import PartialStateError
+from .partials import EntropyPartial, CrossEntropyPartial, ScorePartial
+
+
+def _n_alternatives(data: np.ndarray, component_axis: int) -> int:
+    return data.shape[2] if component_axis == 0 else data.shape[1]
+
+
+def entropy_task(shard: int, data: np.ndarray, index: int, component_axis: int = -1) -> EntropyPartial:
+    """Compute entropy sums for one shard (criteria, alternatives, 4)."""
+    sums = entropy_sums(data, index, component_axis=component_axis)
+    return EntropyPartial(shard, index, _n_alternatives(data, component_axis), sums)
+
+
+def cross_entropy_task(
+    blocks: tuple, x: np.ndarray, y: np.ndarray, index: int, component_axis: int = -1
+) -> CrossEntropyPartial:
+    """
+    Compute cross-entropy similarity sums for one block of shards.
+
+    For a diagonal block (p, p) pass the shard as `x` and None as `y`.
+    """
+    rows = _n_alternatives(x, component_axis)
+    if y is None:
+        sums = cross_entropy_block_sums(x, x, index, exclude_diagonal=True, component_axis=component_axis)
+        pairs = rows * (rows - 1)
+    else:
+        # Off-diagonal blocks stand for (p, q) and (q, p)
+        sums = 2 * cross_entropy_block_sums(x, y, index, component_axis=component_axis)
+        pairs = 2 * rows * _n_alternatives(y, component_axis)
+    return CrossEntropyPartial(blocks, index, pairs, sums)
+
+
+def score_task(
+    shard: int, start: int, data: np.ndarray, weights, index: int, component_axis: int = -1
+) -> ScorePartial:
+    """Compute weighted S+ and S- for the alternatives of one shard."""
+    spos = weighted_reference_scores(data, weights, POSITIVE_REFERENCE, index, component_axis)
+    sneg = weighted_reference_scores(data, weights, NEGATIVE_REFERENCE, index, component_axis)
+    return ScorePartial(shard, index, start, spos, sneg)
+
+
+def run_task(task: dict) -> dict:
+    """
+    Execute one task message and return the resulting partial as a dict.
+
+    Args:
+        task (dict): Task message built by the coordinator.
+
+    Returns:
+        dict: Serializable partial state.
+    """
+    kind = task.get("kind")
+    axis = task.get("component_axis", -1)
+    if kind == "entropy":
+        partial = entropy_task(task["shard"], task["data"], task["index"], axis)
+    elif kind == "cross_entropy":
+        partial = cross_entropy_task(task["blocks"], task["x"], task.get("y"), task["index"], axis)
+    elif kind == "score":
+        partial = score_task(task["shard"], task["start"], task["data"], task["weights"], task["index"], axis)
+    else:
+        raise PartialStateError(f"Unknown task kind: {kind!r}")
+    return partial.to_dict()
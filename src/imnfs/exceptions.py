@@ -120,3 +120,32 @@ class DecisionError(IMNFSException):
         msg = message or "Decision-making process failed. Invalid data or scoring result."
         super().__init__(msg)
 
+
+
+# =====================================================================
+# Distributed Computation Errors
+# =====================================================================
+
+class PartialStateError(IMNFSException):
+    """Raised when partial aggregates from workers are malformed or cannot be merged."""
+    def __init__(self, message=None):
+        msg = message or "Invalid or incompatible partial state received from a worker."
+        super().__init__(msg)
+
+
+# =====================================================================
+# Resource Errors
+# =====================================================================
+
+class MemoryBudgetError(IMNFSException):
+    """Raised when a pipeline stage allocates more memory than its budget."""
+    def __init__(self, message=None):
+        msg = message or "A pipeline stage exceeded its memory budget."
+        super().__init__(msg)
+
+
+class ProfilerUsageError(IMNFSException):
+    """Raised when a profiler is used outside the context that activates it."""
+    def __init__(self, message=None):
+        msg = message or "The profiler is not active."
+        super().__init__(msg)
@@ -1,3 +1,4 @@
-from .loader import load_data
+from .loader import load_data, load_nf_tensor
+from .writer import save_data
 
-__all__ = ["load_data"]
\ No newline at end of file
+__all__ = ["load_data", "load_nf_tensor", "save_data"]
@@ -88,7 +88,7 @@ class DataLoader:
 
     def _load_csv(self):
         try:
-            df = pd.read_csv(self.filepath)
+            df = pd.read_csv(self.filepath, float_precision="round_trip")
             return df.values.tolist()
         except Exception as e:
             raise DataTypeError(received_type="CSV", message=f"Error reading CSV file: {e}")
@@ -130,3 +130,31 @@ def load_data(filepath: str) -> np.ndarray:
         >>> data = load_data("data/sample.json")
     """
     return DataLoader(filepath).load()
+
+
+def table_to_tensor(data: np.ndarray) -> np.ndarray:
+    """
+    Restore a (criteria, alternatives, 4) tensor from the tabular layout of `save_data`.
+
+    TXT, CSV and XLSX files hold one row per criterion with the alternatives'
+    [Mu, T, I, F] values side by side; other shapes are returned unchanged.
+    """
+    data = np.asarray(data)
+    if data.ndim != 2:
+        return data
+    if data.shape[1] % 4:
+        raise ShapeMismatchError(
+            data.shape, (data.shape[0], "4 * alternatives"),
+            message=f"A table of {data.shape[1]} columns does not hold whole [Mu, T, I, F] elements."
+        )
+    return data.reshape(data.shape[0], -1, 4)
+
+
+def load_nf_tensor(filepath: str) -> np.ndarray:
+    """
+    Load an NF tensor from any supported format, reshaping tabular files.
+
+    Example:
+        >>> rnf = RNF(NFSet(load_nf_tensor("data/sample.csv")), cost=[0])
+    """
+    return table_to_tensor(load_data(filepath))
@@ -0,0 +1,114 @@
+import json
+import pandas as pd
+import numpy as np
+from pathlib import Path
+
+from imnfs.io.loader import DataLoader
+from imnfs.exceptions import (
+    EmptyDataError,
+    InvalidTypeError,
+    ShapeMismatchError,
+)
+
+# Sheet size limits of the XLSX format (one row is taken by the header)
+XLSX_MAX_ROWS = 1_048_576
+XLSX_MAX_COLUMNS = 16_384
+
+
+class DataWriter:
+    """
+    Writes NF arrays in every format read by DataLoader.
+
+    JSON keeps the full nested shape. TXT, CSV and XLSX are tabular: a 3D
+    (criteria, alternatives, 4) tensor is written as one row per criterion
+    with the alternatives' [Mu, T, I, F] values side by side, so the loaded
+    array is restored with `.reshape(n_criteria, -1, 4)` (see `load_nf_tensor`). Values round-trip
+    exactly except in XLSX, which keeps 15 significant digits.
+
+    An XLSX sheet holds at most 16 384 columns, i.e. 4096 alternatives per
+    criterion row; larger tensors must be written as JSON, TXT or CSV.
+    """
+
+    SUPPORTED_FORMATS = DataLoader.SUPPORTED_FORMATS
+
+    def __init__(self, filepath: str):
+        self.filepath = Path(filepath)
+        if self.filepath.suffix.lower() not in self.SUPPORTED_FORMATS:
+            raise InvalidTypeError(
+                var_name="file extension",
+                expected_type=self.SUPPORTED_FORMATS,
+                received_type=self.filepath.suffix,
+                message=f"Unsupported file format '{self.filepath.suffix}'. "
+                        f"Supported: {', '.join(self.SUPPORTED_FORMATS)}"
+            )
+
+    # --------------------------------------------------
+    # Dispatcher
+    # --------------------------------------------------
+
+    def save(self, data) -> Path:
+        """Dispatch file writing based on extension."""
+        arr = np.asarray(data, dtype=float)
+        if arr.size == 0:
+            raise EmptyDataError("Cannot write empty data.")
+
+        ext = self.filepath.suffix.lower()
+        if ext == ".json":
+            self._save_json(arr)
+        elif ext == ".txt":
+            self._save_txt(self._to_table(arr))
+        elif ext == ".csv":
+            self._to_frame(arr).to_csv(self.filepath, index=False, float_format="%.17g")
+        elif ext == ".xlsx":
+            self._check_xlsx_size(self._to_table(arr).shape)
+            self._to_frame(arr).to_excel(self.filepath, index=False)
+        return self.filepath
+
+    # --------------------------------------------------
+    # File-specific writers
+    # --------------------------------------------------
+
+    def _save_json(self, arr: np.ndarray):
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            json.dump(arr.tolist(), f)
+
+    def _check_xlsx_size(self, shape: tuple):
+        rows, columns = (shape[0], 1) if len(shape) == 1 else shape
+        if rows + 1 > XLSX_MAX_ROWS or columns > XLSX_MAX_COLUMNS:
+            raise ShapeMismatchError(
+                shape, (XLSX_MAX_ROWS - 1, XLSX_MAX_COLUMNS),
+                message=f"Table of {rows} rows x {columns} columns exceeds the XLSX sheet limit of "
+                        f"{XLSX_MAX_ROWS - 1} data rows x {XLSX_MAX_COLUMNS} columns "
+                        f"(4096 alternatives per criterion); use .csv, .txt or .json instead."
+            )
+
+    def _save_txt(self, table: np.ndarray):
+        np.savetxt(self.filepath, table, fmt="%.17g")
+
+    @staticmethod
+    def _to_table(arr: np.ndarray) -> np.ndarray:
+        """Flatten to 2D, one row per leading index."""
+        return arr.reshape(arr.shape[0], -1) if arr.ndim != 2 else arr
+
+    def _to_frame(self, arr: np.ndarray) -> pd.DataFrame:
+        table = self._to_table(arr)
+        if arr.ndim == 3 and arr.shape[2] == 4:
+            columns = [f"A{j + 1}_{c}" for j in range(arr.shape[1]) for c in ("Mu", "T", "I", "F")]
+        else:
+            columns = [f"c{j + 1}" for j in range(table.shape[1])]
+        return pd.DataFrame(table, columns=columns)
+
+
+# =====================================================================
+# Helper function (shortcut)
+# =====================================================================
+
+def save_data(data, filepath: str) -> Path:
+    """
+    Quick utility wrapper to write an NF array to a file.
+
+    Example:
+        >>> save_data(tensor, "data/sample.csv")
+        >>> load_nf_tensor("data/sample.csv")  # same shape as `tensor`
+    """
+    return DataWriter(filepath).save(data)
@@ -2,8 +2,38 @@ from abc import ABC, abstractmethod
 import numpy as np
 
 class SimilarityMeasure(ABC):
+    # True when the measure depends on the vectors only through their L1
+    # distance d = sum(|a - b|); such measures define `from_distance(d)`
+    distance_based = False
+
+    # True when the measure is g(sum over components of h(a - b)) with an even
+    # h; such measures define `component_term(delta)` (h) and `from_component_sum(s)` (g)
+    separable = False
+
     @staticmethod
     @abstractmethod
     def compute(a: np.ndarray, b: np.ndarray) -> float:
         """Compute similarity between two NFS vectors."""
         pass
+
+    @classmethod
+    def compute_batch(cls, a: np.ndarray, b: np.ndarray, axis: int = -1) -> np.ndarray:
+        """
+        Compute similarity between broadcastable stacks of NFS vectors.
+
+        `axis` holds the NF components (Mu, T, I, F): -1 for row-major
+        (..., 4) arrays, 0 for component-major (4, ...) arrays; every other
+        axis is broadcast. Distance-based measures apply `from_distance` to
+        the L1 distance, separable ones `from_component_sum` to the summed
+        component terms; others fall back to calling `compute` per vector pair.
+        """
+        if cls.distance_based:
+            return cls.from_distance(np.sum(np.abs(np.subtract(a, b)), axis=axis))
+        if cls.separable:
+            return cls.from_component_sum(np.sum(cls.component_term(np.subtract(a, b)), axis=axis))
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+        a, b = np.moveaxis(a, axis, -1), np.moveaxis(b, axis, -1)
+        flat_a = a.reshape(-1, a.shape[-1])
+        flat_b = b.reshape(-1, b.shape[-1])
+        out = np.array([cls.compute(x, y) for x, y in zip(flat_a, flat_b)], dtype=float)
+        return out.reshape(a.shape[:-1])
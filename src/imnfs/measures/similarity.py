@@ -11,6 +11,8 @@ def cot(x):
     return 1 / np.tan(x)
 # --- Similarity 1 ---
 class Similarity1(SimilarityMeasure):
+    separable = True
+
     @staticmethod
     @latexify.function(
         identifiers={"compute": "Similarity_1"},
@@ -23,9 +25,19 @@ class Similarity1(SimilarityMeasure):
         out = (np.sqrt(2) + 1) / 4 * (np.sqrt(2) *np.sum(t) - 4)
         return out
 
+    @staticmethod
+    def component_term(delta: np.ndarray) -> np.ndarray:
+        return np.cos(delta * π / 4)
+
+    @staticmethod
+    def from_component_sum(s: np.ndarray) -> np.ndarray:
+        return (np.sqrt(2) + 1) / 4 * (np.sqrt(2) * s - 4)
+
 
 # --- Similarity 2 ---
 class Similarity2(SimilarityMeasure):
+    distance_based = True
+
     @staticmethod
     @latexify.function(
         identifiers={"compute": "Similarity_2"},
@@ -37,9 +49,15 @@ class Similarity2(SimilarityMeasure):
         out = 1 - np.sum(t) / 4
         return out
 
+    @staticmethod
+    def from_distance(d: np.ndarray) -> np.ndarray:
+        return 1 - d / 4
+
 
 # --- Similarity 3 ---
 class Similarity3(SimilarityMeasure):
+    distance_based = True
+
     @staticmethod
     @latexify.function(
         identifiers={"compute": "Similarity_3"},
@@ -51,9 +69,15 @@ class Similarity3(SimilarityMeasure):
         out = np.log2(2 - np.sum(t) / 4)
         return out
 
+    @staticmethod
+    def from_distance(d: np.ndarray) -> np.ndarray:
+        return np.log2(2 - d / 4)
+
 
 # --- Similarity 4 ---
 class Similarity4(SimilarityMeasure):
+    distance_based = True
+
     @staticmethod
     @latexify.function(
         identifiers={"compute": "Similarity_4"},
@@ -65,9 +89,15 @@ class Similarity4(SimilarityMeasure):
         out = 1 - np.log2(1 + np.sum(t) / 4)
         return out
 
+    @staticmethod
+    def from_distance(d: np.ndarray) -> np.ndarray:
+        return 1 - np.log2(1 + d / 4)
+
 
 # --- Similarity 5 ---
 class Similarity5(SimilarityMeasure):
+    distance_based = True
+
     @staticmethod
     @latexify.function(
         identifiers={"compute": "Similarity_5"},
@@ -79,9 +109,15 @@ class Similarity5(SimilarityMeasure):
         out = (e**(-np.sum(t) / 4) - e**(-1)) / (1 - e**(-1))
         return out
 
+    @staticmethod
+    def from_distance(d: np.ndarray) -> np.ndarray:
+        return (e**(-d / 4) - e**(-1)) / (1 - e**(-1))
+
 
 # --- Similarity 6 ---
 class Similarity6(SimilarityMeasure):
+    distance_based = True
+
     @staticmethod
     @latexify.function(
         identifiers={"compute": "Similarity_6"},
@@ -93,9 +129,15 @@ class Similarity6(SimilarityMeasure):
         out = 1 - np.sin(np.sum(t) * π / 8)
         return out
 
+    @staticmethod
+    def from_distance(d: np.ndarray) -> np.ndarray:
+        return 1 - np.sin(d * π / 8)
+
 
 # --- Similarity 7 ---
 class Similarity7(SimilarityMeasure):
+    distance_based = True
+
     @staticmethod
     @latexify.function(
         identifiers={"compute": "Similarity_7"},
@@ -107,9 +149,15 @@ class Similarity7(SimilarityMeasure):
         out = np.cos(np.sum(t) * π / 8)
         return out
 
+    @staticmethod
+    def from_distance(d: np.ndarray) -> np.ndarray:
+        return np.cos(d * π / 8)
+
 
 # --- Similarity 8 ---
 class Similarity8(SimilarityMeasure):
+    distance_based = True
+
     @staticmethod
     @latexify.function(
         identifiers={"compute": "Similarity_8"},
@@ -121,9 +169,15 @@ class Similarity8(SimilarityMeasure):
         out = 1 - np.tan(np.sum(t) * π / 16)
         return out
 
+    @staticmethod
+    def from_distance(d: np.ndarray) -> np.ndarray:
+        return 1 - np.tan(d * π / 16)
+
 
 # --- Similarity 9 ---
-class Similarity9:
+class Similarity9(SimilarityMeasure):
+    distance_based = True
+
     @staticmethod
     @latexify.function(
         identifiers={"compute": "Similarity_9"},
@@ -133,4 +187,8 @@ class Similarity9:
     def compute(a: np.ndarray, b: np.ndarray) -> float:
         t = np.abs(Delta(a, b))
         out = cot(π / 4 + np.sum(t) * π / 16)
-        return out
\ No newline at end of file
+        return out
+
+    @staticmethod
+    def from_distance(d: np.ndarray) -> np.ndarray:
+        return cot(π / 4 + d * π / 16)
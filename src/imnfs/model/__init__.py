@@ -1,4 +1,6 @@
 from .nfs import NFSet
 from .rnf import RNF
+from .lazy import LazyNFSet
+from .validation import ValidatedNF, validate_nf
 
-__all__ = ["NFSet", "RNF"]
\ No newline at end of file
+__all__ = ["NFSet", "RNF", "LazyNFSet", "ValidatedNF", "validate_nf"]
@@ -0,0 +1,274 @@
+from typing import Dict, List, Tuple
+import numpy as np
+from imnfs.model.nfs import NFSet
+from imnfs.exceptions import (
+    DataTypeError,
+    ShapeMismatchError,
+    NFComputationError,
+)
+
+# Elements evaluated per step of the fused pass (keeps the working set in cache)
+CHUNK_SIZE = 16384
+
+
+class LazyNFSet:
+    """
+    Deferred NFSet expression.
+
+    `complement`, `intersection` and `union` only record a node; shapes are
+    checked when the node is built. The graph is compiled into one program
+    over the Mu/T/I/F planes, with shared sub-expressions computed once, and
+    run in a single chunked pass when `evaluate()`, `data` or `issubset`
+    needs a value.
+
+    Create one with `NFSet.lazy()`.
+    """
+
+    __slots__ = ("op", "children", "shape", "_value")
+
+    def __init__(self, op: str, children: tuple, shape: tuple, value: NFSet = None):
+        self.op = op
+        self.children = children
+        self.shape = shape
+        self._value = value
+
+    @classmethod
+    def leaf(cls, nfs: NFSet) -> "LazyNFSet":
+        if not isinstance(nfs, NFSet):
+            raise DataTypeError(type(nfs), "NFSet")
+        return cls("leaf", (), nfs.data.shape, nfs)
+
+    @staticmethod
+    def _wrap(other) -> "LazyNFSet":
+        if isinstance(other, LazyNFSet):
+            return other
+        if isinstance(other, NFSet):
+            return LazyNFSet.leaf(other)
+        raise DataTypeError(type(other), "NFSet or LazyNFSet")
+
+    def _binary(self, op: str, other) -> "LazyNFSet":
+        other = self._wrap(other)
+        if self.shape != other.shape:
+            raise ShapeMismatchError(self.shape, other.shape)
+        return LazyNFSet(op, (self, other), self.shape)
+
+    # ----------------------------------------------------------------------
+    # Graph construction
+    # ----------------------------------------------------------------------
+
+    def complement(self) -> "LazyNFSet":
+        """Deferred complement of this NF-set."""
+        return LazyNFSet("complement", (self,), self.shape)
+
+    def intersection(self, other) -> "LazyNFSet":
+        """Deferred intersection with another NF-set."""
+        return self._binary("intersection", other)
+
+    def union(self, other) -> "LazyNFSet":
+        """Deferred union with another NF-set."""
+        return self._binary("union", other)
+
+    # ----------------------------------------------------------------------
+    # Evaluation
+    # ----------------------------------------------------------------------
+
+    def evaluate(self) -> NFSet:
+        """Run the fused program and return (and cache) the resulting NFSet."""
+        if self._value is None:
+            program = _Program([self])
+            self._value = program.materialize()[0]
+        return self._value
+
+    @property
+    def data(self) -> np.ndarray:
+        """Array-of-structs view of the evaluated NF-set."""
+        return self.evaluate().data
+
+    @property
+    def components(self) -> np.ndarray:
+        """Component-major view of the evaluated NF-set."""
+        return self.evaluate().components
+
+    def issubset(self, other) -> bool:
+        """Check subset-hood chunk by chunk, without materializing either side."""
+        other = self._wrap(other)
+        if self.shape != other.shape:
+            raise ShapeMismatchError(self.shape, other.shape)
+        return _Program([self, other]).subset()
+
+    def __repr__(self):
+        leaves: Dict[int, int] = {}
+        text: Dict[int, str] = {}
+        # Post-order with an explicit stack, like `_Program._compile`
+        stack = [self]
+        while stack:
+            node = stack[-1]
+            if id(node) in text:
+                stack.pop()
+                continue
+            if node.op == "leaf" or node._value is not None:
+                text[id(node)] = f"#{leaves.setdefault(id(node._value), len(leaves))}"
+            else:
+                pending = [c for c in node.children if id(c) not in text]
+                if pending:
+                    stack.extend(reversed(pending))
+                    continue
+                text[id(node)] = f"{node.op}({', '.join(text[id(c)] for c in node.children)})"
+            stack.pop()
+
+        return f"LazyNFSet({text[id(self)]}, shape={self.shape})"
+
+
+class _Program:
+    """
+    Compiled form of one or more lazy graphs.
+
+    Every instruction produces one component plane: ("leaf", slot, c),
+    ("neg", a) for 1 - a, ("min", a, b) or ("max", a, b). Instructions are
+    interned, so identical sub-expressions, double complements and
+    min(x, x) collapse to a single register, and instructions no output
+    depends on are dropped before execution.
+    """
+
+    def __init__(self, roots: List[LazyNFSet]):
+        self.instructions: List[tuple] = []
+        self._interned: Dict[tuple, int] = {}
+        self._compiled: Dict[int, Tuple[int, int, int, int]] = {}
+        self.leaves: List[NFSet] = []
+        self._leaf_slots: Dict[int, int] = {}
+        self.outputs = [self._compile(root) for root in roots]
+        self._prune()
+        self.shape = roots[0].shape
+        self.size = int(np.prod(self.shape[:-1]))
+
+    # ----------------------------------------------------------------------
+    # Compilation
+    # ----------------------------------------------------------------------
+
+    def _intern(self, instr: tuple) -> int:
+        if instr not in self._interned:
+            self._interned[instr] = len(self.instructions)
+            self.instructions.append(instr)
+        return self._interned[instr]
+
+    def _neg(self, a: int) -> int:
+        instr = self.instructions[a]
+        if instr[0] == "neg":
+            return instr[1]
+        return self._intern(("neg", a))
+
+    def _minmax(self, op: str, a: int, b: int) -> int:
+        if a == b:
+            return a
+        return self._intern((op, min(a, b), max(a, b)))
+
+    def _compile(self, root: LazyNFSet) -> Tuple[int, int, int, int]:
+        """Compile a graph bottom-up with an explicit stack (chains may be deeper than the recursion limit)."""
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            if id(node) in self._compiled:
+                stack.pop()
+                continue
+            if node._value is None:
+                pending = [c for c in node.children if id(c) not in self._compiled]
+                if pending:
+                    # Children first, left to right
+                    stack.extend(reversed(pending))
+                    continue
+            stack.pop()
+            self._compiled[id(node)] = self._emit(node)
+        return self._compiled[id(root)]
+
+    def _emit(self, node: LazyNFSet) -> Tuple[int, int, int, int]:
+        """Instructions of one node whose children are already compiled."""
+        if node._value is not None:
+            store_id = id(node._value)
+            if store_id not in self._leaf_slots:
+                self._leaf_slots[store_id] = len(self.leaves)
+                self.leaves.append(node._value)
+            slot = self._leaf_slots[store_id]
+            return tuple(self._intern(("leaf", slot, c)) for c in range(4))
+        if node.op == "complement":
+            mu, t, i, f = self._compiled[id(node.children[0])]
+            return self._neg(mu), f, self._neg(i), t
+
+        a = self._compiled[id(node.children[0])]
+        b = self._compiled[id(node.children[1])]
+        lo, hi = ("min", "max") if node.op == "intersection" else ("max", "min")
+        return (
+            self._minmax(lo, a[0], b[0]),
+            self._minmax(lo, a[1], b[1]),
+            self._minmax(hi, a[2], b[2]),
+            self._minmax(hi, a[3], b[3]),
+        )
+
+    def _prune(self):
+        """Drop instructions no output depends on (e.g. both negations of a double complement)."""
+        live = {r for outputs in self.outputs for r in outputs}
+        for r in range(len(self.instructions) - 1, -1, -1):
+            instr = self.instructions[r]
+            if r in live and instr[0] != "leaf":
+                live.update(instr[1:])
+        renumber = {old: new for new, old in enumerate(sorted(live))}
+        self.instructions = [
+            self.instructions[r] if self.instructions[r][0] == "leaf"
+            else (self.instructions[r][0],) + tuple(renumber[a] for a in self.instructions[r][1:])
+            for r in sorted(live)
+        ]
+        self.outputs = [tuple(renumber[r] for r in outputs) for outputs in self.outputs]
+
+    # ----------------------------------------------------------------------
+    # Execution
+    # ----------------------------------------------------------------------
+
+    def _chunks(self):
+        """Run the program chunk by chunk, yielding (slice, registers)."""
+        planes = [leaf.components.reshape(4, -1) for leaf in self.leaves]
+        chunk = min(CHUNK_SIZE, max(1, self.size))
+        buffers = [None if instr[0] == "leaf" else np.empty(chunk) for instr in self.instructions]
+        registers: List[np.ndarray] = [None] * len(self.instructions)
+
+        for start in range(0, self.size, chunk):
+            sl = slice(start, min(start + chunk, self.size))
+            m = sl.stop - sl.start
+            for r, instr in enumerate(self.instructions):
+                op = instr[0]
+                if op == "leaf":
+                    registers[r] = planes[instr[1]][instr[2], sl]
+                elif op == "neg":
+                    registers[r] = np.subtract(1, registers[instr[1]], out=buffers[r][:m])
+                elif op == "min":
+                    registers[r] = np.minimum(registers[instr[1]], registers[instr[2]], out=buffers[r][:m])
+                else:
+                    registers[r] = np.maximum(registers[instr[1]], registers[instr[2]], out=buffers[r][:m])
+            yield sl, registers
+
+    def materialize(self) -> List[NFSet]:
+        """Evaluate every root into a new NFSet, stored in the layout of the first leaf."""
+        layout = self.leaves[0].layout
+        try:
+            # (4, size) plane views over the output stores
+            stores = [np.empty((4, self.size)) if layout == "soa" else np.empty((self.size, 4))
+                      for _ in self.outputs]
+            planes = [store if layout == "soa" else store.T for store in stores]
+            for sl, registers in self._chunks():
+                for outputs, plane in zip(self.outputs, planes):
+                    for c in range(4):
+                        plane[c, sl] = registers[outputs[c]]
+        except Exception as e:
+            raise NFComputationError(f"Lazy evaluation failed: {e}")
+
+        shape = (4,) + self.shape[:-1] if layout == "soa" else self.shape
+        return [NFSet._from_store(store.reshape(shape), layout) for store in stores]
+
+    def subset(self) -> bool:
+        """First root is a subset of the second: Mu, T <= and I, F >=."""
+        a, b = self.outputs
+        for _, registers in self._chunks():
+            if not (np.all(registers[a[0]] <= registers[b[0]]) and
+                    np.all(registers[a[1]] <= registers[b[1]]) and
+                    np.all(registers[a[2]] >= registers[b[2]]) and
+                    np.all(registers[a[3]] >= registers[b[3]])):
+                return False
+        return True
@@ -1,89 +1,201 @@
 from typing import List, Union
 import numpy as np
+from imnfs.model.validation import ValidatedNF, validate_nf
 from imnfs.exceptions import (
-    EmptyDataError,
     DataTypeError,
+    InvalidTypeError,
     ShapeMismatchError,
     NFComputationError,
 )
 
+# Storage layouts:
+#   "aos" - array of structs, components on the last axis (..., 4)
+#   "soa" - structure of arrays, contiguous component planes (4, ...)
+LAYOUTS = ("aos", "soa")
+
+
+def check_layout(layout: str) -> str:
+    """Validate a storage layout name."""
+    if layout not in LAYOUTS:
+        raise InvalidTypeError(
+            var_name="layout", expected_type=LAYOUTS, received_type=layout,
+            message=f"Unknown layout '{layout}'. Expected one of: {', '.join(LAYOUTS)}"
+        )
+    return layout
+
+
+def to_layout(arr: np.ndarray, source: str, target: str) -> np.ndarray:
+    """Convert an NF array between storage layouts (no copy if unchanged)."""
+    if source == target:
+        return arr
+    if target == "soa":
+        return np.ascontiguousarray(np.moveaxis(arr, -1, 0))
+    return np.ascontiguousarray(np.moveaxis(arr, 0, -1))
+
+
+def aos_view(store: np.ndarray, layout: str) -> np.ndarray:
+    """Array-of-structs view (..., 4) of a stored NF array."""
+    return store if layout == "aos" else np.moveaxis(store, 0, -1)
+
+
+def soa_view(store: np.ndarray, layout: str) -> np.ndarray:
+    """Component-major view (4, ...) of a stored NF array."""
+    return store if layout == "soa" else np.moveaxis(store, -1, 0)
+
 
 class NFSet:
     """
     Neutrosophic Fuzzy Set (NFSet) with operations:
     subset, complement, intersection, union.
     Each element: [Mu, T, I, F]
+
+    Elements are stored either as rows (layout="aos", the default) or as
+    four contiguous component planes (layout="soa"). `data` always exposes
+    the row view and `components` the component-major view.
     """
 
-    def __init__(self, data: Union[List[List[float]], np.ndarray]):
+    __slots__ = ("_store", "layout")
+
+    def __init__(self, data: Union[List[List[float]], np.ndarray, ValidatedNF], layout: str = "aos",
+                 validate: bool = True):
         """
         Initialize NFSet with data.
 
         Args:
-            data (List[List[float]] | np.ndarray): NF-set elements.
+            data (List[List[float]] | np.ndarray | ValidatedNF): NF-set elements, or
+                a token from `validate_nf` (used as is, without copy or re-check).
+            layout (str): Storage layout, "aos" or "soa".
+            validate (bool): Check shape, NaN/inf and the [0, 1] range with
+                `validate_nf`. Pass False for data already checked upstream.
         """
-        if data is None or (isinstance(data, (list, np.ndarray)) and len(data) == 0):
-            raise EmptyDataError("NFSet cannot be initialized with empty data.")
+        self.layout = check_layout(layout)
 
-        if not isinstance(data, (list, np.ndarray)):
-            raise DataTypeError(type(data))
+        # The layout conversion to "soa" already makes the private copy
+        copy = layout == "aos"
+        if isinstance(data, ValidatedNF):
+            arr = data.data
+        elif validate:
+            arr = validate_nf(data, copy=copy).data
+        else:
+            arr = np.array(data, dtype=float) if copy else np.asarray(data, dtype=float)
 
-        arr = np.array(data, dtype=float)
-        self.data = arr
+        self._store = to_layout(arr, "aos", layout)
+
+    @classmethod
+    def _from_store(cls, store: np.ndarray, layout: str) -> "NFSet":
+        """Wrap an already-laid-out array without copying."""
+        obj = cls.__new__(cls)
+        obj._store = store
+        obj.layout = layout
+        return obj
 
     # ----------------------------------------------------------------------
-    # Logical / Set Operations
+    # Storage views
     # ----------------------------------------------------------------------
 
-    def issubset(self, other: "NFSet") -> bool:
-        """Check if this NF-set is a subset of another NF-set."""
+    @property
+    def data(self) -> np.ndarray:
+        """Array-of-structs view, components on the last axis."""
+        return aos_view(self._store, self.layout)
+
+    @data.setter
+    def data(self, value):
+        self._store = to_layout(np.asarray(value, dtype=float), "aos", self.layout)
+
+    @property
+    def components(self) -> np.ndarray:
+        """Component-major view (Mu, T, I, F planes on the first axis)."""
+        return soa_view(self._store, self.layout)
+
+    def to_layout(self, layout: str) -> "NFSet":
+        """Return this NF-set stored in another layout."""
+        layout = check_layout(layout)
+        return NFSet._from_store(to_layout(self._store, self.layout, layout), layout)
+
+    @staticmethod
+    def _operand(other) -> "NFSet":
+        """Other operand of a set operation; a LazyNFSet is evaluated first."""
+        from imnfs.model.lazy import LazyNFSet
+        if isinstance(other, LazyNFSet):
+            return other.evaluate()
         if not isinstance(other, NFSet):
-            raise DataTypeError(type(other), "NFSet")
+            raise DataTypeError(type(other), "NFSet or LazyNFSet")
+        return other
 
+    def _planes(self, other: "NFSet") -> np.ndarray:
+        """Other set's store in this set's layout."""
+        return to_layout(other._store, other.layout, self.layout)
+
+    def _part(self, arr: np.ndarray, sl):
+        """Slice component(s) `sl` of a store in this set's layout."""
+        return arr[sl] if self.layout == "soa" else arr[..., sl]
+
+    # ----------------------------------------------------------------------
+    # Logical / Set Operations
+    # ----------------------------------------------------------------------
+
+    def issubset(self, other: "NFSet") -> bool:
+        """Check if this NF-set is a subset of another NF-set (or evaluated LazyNFSet)."""
+        other = self._operand(other)
         if self.data.shape != other.data.shape:
             raise ShapeMismatchError(self.data.shape, other.data.shape)
 
-        return np.all(
-            (self.data[:, 0] <= other.data[:, 0]) &  # Mu
-            (self.data[:, 1] <= other.data[:, 1]) &  # T
-            (self.data[:, 2] >= other.data[:, 2]) &  # I
-            (self.data[:, 3] >= other.data[:, 3])    # F
+        a, b = self._store, self._planes(other)
+        return bool(
+            np.all(self._part(a, slice(0, 2)) <= self._part(b, slice(0, 2))) and  # Mu, T
+            np.all(self._part(a, slice(2, 4)) >= self._part(b, slice(2, 4)))      # I, F
         )
 
     def complement(self) -> "NFSet":
         """Compute the complement of this NF-set."""
         try:
-            comp_data = np.stack([
-                1 - self.data[:, 0],  # Mu_new
-                self.data[:, 3],      # T_new
-                1 - self.data[:, 2],  # I_new
-                self.data[:, 1]       # F_new
-            ], axis=1)
-            return NFSet(comp_data)
+            a = self._store
+            out = np.empty_like(a)
+            np.subtract(1, self._part(a, 0), out=self._part(out, 0))  # Mu_new
+            self._part(out, 1)[...] = self._part(a, 3)               # T_new
+            np.subtract(1, self._part(a, 2), out=self._part(out, 2))  # I_new
+            self._part(out, 3)[...] = self._part(a, 1)               # F_new
+            return NFSet._from_store(out, self.layout)
         except Exception as e:
             raise NFComputationError(f"Failed to compute complement: {e}")
 
     def intersection(self, other: "NFSet") -> "NFSet":
-        """Compute intersection with another NF-set."""
+        """Compute intersection with another NF-set (a LazyNFSet is evaluated first)."""
+        other = self._operand(other)
         if self.data.shape != other.data.shape:
             raise ShapeMismatchError(self.data.shape, other.data.shape)
         try:
-            T = np.minimum(self.data[:, :2], other.data[:, :2])
-            F = np.maximum(self.data[:, 2:], other.data[:, 2:])
-            return NFSet(np.hstack([T, F]))
+            a, b = self._store, self._planes(other)
+            out = np.empty_like(a)
+            np.minimum(self._part(a, slice(0, 2)), self._part(b, slice(0, 2)), out=self._part(out, slice(0, 2)))
+            np.maximum(self._part(a, slice(2, 4)), self._part(b, slice(2, 4)), out=self._part(out, slice(2, 4)))
+            return NFSet._from_store(out, self.layout)
         except Exception as e:
             raise NFComputationError(f"Intersection failed: {e}")
 
     def union(self, other: "NFSet") -> "NFSet":
-        """Compute union with another NF-set."""
+        """Compute union with another NF-set (a LazyNFSet is evaluated first)."""
+        other = self._operand(other)
         if self.data.shape != other.data.shape:
             raise ShapeMismatchError(self.data.shape, other.data.shape)
         try:
-            T = np.maximum(self.data[:, :2], other.data[:, :2])
-            F = np.minimum(self.data[:, 2:], other.data[:, 2:])
-            return NFSet(np.hstack([T, F]))
+            a, b = self._store, self._planes(other)
+            out = np.empty_like(a)
+            np.maximum(self._part(a, slice(0, 2)), self._part(b, slice(0, 2)), out=self._part(out, slice(0, 2)))
+            np.minimum(self._part(a, slice(2, 4)), self._part(b, slice(2, 4)), out=self._part(out, slice(2, 4)))
+            return NFSet._from_store(out, self.layout)
         except Exception as e:
             raise NFComputationError(f"Union failed: {e}")
 
+    def lazy(self):
+        """
+        Start a lazy expression on this NF-set.
+
+        Operations on the returned LazyNFSet build an expression graph that
+        is evaluated in one fused pass by `evaluate()`, `data` or `issubset`.
+        """
+        from imnfs.model.lazy import LazyNFSet
+        return LazyNFSet.leaf(self)
+
     def __repr__(self):
         return f"NFSet(\n{self.data}\n)"
@@ -1,10 +1,9 @@
-from typing import List
+from typing import List, Union
 import numpy as np
-from imnfs.model.nfs import NFSet
+from imnfs.model.nfs import NFSet, check_layout, to_layout, aos_view, soa_view
+from imnfs.model.validation import ValidatedNF, validate_cost
 from imnfs.exceptions import (
-    EmptyDataError,
     DataTypeError,
-    InvalidIndexError,
     NFComputationError,
 )
 
@@ -14,29 +13,99 @@ class RNF:
     RNF (Refined Neutrosophic Fuzzy operations) class
     - Stores NF-set data internally
     - Provides selective complement for specified indices
+    - Keeps the boolean mask of complemented (cost) criteria in `cost_mask`
     """
 
-    def __init__(self, nfs: NFSet, cost: list):
+    __slots__ = ("_store", "layout", "cost_mask")
+
+    def __init__(self, nfs: Union[NFSet, ValidatedNF], cost: list = None, layout: str = None,
+                 validate: bool = True):
         """
         Initialize RNF with NFSet data.
 
         Args:
-            nfs (NFSet): NFSet object containing NF-set elements
-            cost (list): List of indices to apply complement
+            nfs (NFSet | ValidatedNF): NFSet object containing NF-set elements, or a
+                token from `validate_nf` (its cost indices are used when `cost` is None)
+            cost (list | np.ndarray, optional): Indices of the criteria to complement, or
+                a boolean mask over the criteria. None means no cost criteria.
+            layout (str, optional): Storage layout, "aos" or "soa". Defaults to the layout of `nfs`.
+            validate (bool): Check the cost indices. Pass False for indices already checked upstream.
         """
-        if not isinstance(nfs, NFSet):
+        if isinstance(nfs, ValidatedNF):
+            token = nfs
+            nfs = NFSet(token)
+            if cost is None and token.cost_mask is not None:
+                cost, validate = token.cost_mask, False
+        elif not isinstance(nfs, NFSet):
             raise DataTypeError(type(nfs), "NFSet")
 
+        self.layout = check_layout(layout or nfs.layout)
+        mask = self._cost_mask(cost, nfs.data.shape[0], validate)
+        self.cost_mask = mask
+
+        if not mask.any():
+            self._store = to_layout(nfs._store, nfs.layout, self.layout)
+        else:
+            self._store = self._complement_rows(nfs, mask, self.layout)
+
+    @classmethod
+    def _from_store(cls, store: np.ndarray, layout: str, cost_mask: np.ndarray) -> "RNF":
+        """Wrap an already-complemented, already-laid-out array without copying."""
+        obj = cls.__new__(cls)
+        obj._store = store
+        obj.layout = layout
+        obj.cost_mask = cost_mask
+        return obj
+
+    @staticmethod
+    def _cost_mask(cost, n_criteria: int, validate: bool) -> np.ndarray:
+        """Boolean mask of the cost criteria."""
         if cost is None:
-            raise EmptyDataError("Cost index list cannot be None.")
+            return np.zeros(n_criteria, dtype=bool)
+        if validate:
+            return validate_cost(cost, n_criteria)
+        if isinstance(cost, np.ndarray) and cost.dtype == bool:
+            return cost
+        mask = np.zeros(n_criteria, dtype=bool)
+        mask[np.asarray(cost, dtype=np.intp)] = True
+        return mask
 
-        if not all(isinstance(i, int) for i in cost):
-            raise DataTypeError("Invalid element in cost list — must be integers.")
+    @staticmethod
+    def _complement_rows(nfs: NFSet, mask: np.ndarray, layout: str) -> np.ndarray:
+        """New store in `layout` with the criteria selected by `mask` complemented in one pass."""
+        result = to_layout(nfs._store, nfs.layout, layout)
+        # The conversion may return the store itself or a view of it (e.g. a
+        # single alternative that is already contiguous in both layouts)
+        if np.may_share_memory(result, nfs._store):
+            result = result.copy()
+        # Broadcast the criteria mask over alternatives and components
+        where = mask.reshape((1, -1) + (1,) * (result.ndim - 2)) if layout == "soa" \
+            else mask.reshape((-1,) + (1,) * (result.ndim - 1))
+        np.subtract(1, result, out=result, where=where)
+        return result
 
-        if len(cost) == 0:
-            self.data = nfs.data
-        else:
-            self.data = self.rnf(nfs, cost)
+    # ----------------------------------------------------------------------
+    # Storage views
+    # ----------------------------------------------------------------------
+
+    @property
+    def data(self) -> np.ndarray:
+        """Array-of-structs view (criteria, alternatives, 4)."""
+        return aos_view(self._store, self.layout)
+
+    @data.setter
+    def data(self, value):
+        self._store = to_layout(np.asarray(value, dtype=float), "aos", self.layout)
+
+    @property
+    def components(self) -> np.ndarray:
+        """Component-major view (4, criteria, alternatives)."""
+        return soa_view(self._store, self.layout)
+
+    @property
+    def component_axis(self) -> int:
+        """Axis of the stored array that holds the NF components."""
+        return 0 if self.layout == "soa" else -1
 
     # ----------------------------------------------------------------------
     # Core Operations
@@ -50,14 +119,8 @@ class RNF:
 
     def rnf(self, nfs: NFSet, indices: List[int]):
         """Apply complement to elements at specified indices."""
-        result = nfs.data.copy()
-
-        for i in indices:
-            if i < 0 or i >= len(result):
-                raise InvalidIndexError(i)
-            try:
-                result[i] = self.neg(result[i])
-            except Exception as e:
-                raise NFComputationError(f"Complement at index {i} failed: {e}")
-
-        return result
+        mask = validate_cost(indices, len(nfs.data))
+        try:
+            return self._complement_rows(nfs, mask, "aos")
+        except Exception as e:
+            raise NFComputationError(f"Complement failed: {e}")
@@ -0,0 +1,136 @@
+from typing import Optional, Sequence
+import numpy as np
+from imnfs.exceptions import (
+    EmptyDataError,
+    DataTypeError,
+    InvalidIndexError,
+    ShapeMismatchError,
+)
+
+# Elements checked per step of the range scan (bounds the scratch buffer)
+CHUNK_SIZE = 4096
+
+# Slack on the [0, 1] bounds for rounding in derived data (e.g. weighted means)
+RANGE_TOLERANCE = 1e-12
+
+
+class ValidatedNF:
+    """
+    Token for NF data that passed `validate_nf`.
+
+    Holds a private float64 copy of the data (components on the last axis)
+    and, when costs were given, the boolean mask of cost criteria. `NFSet`
+    and `RNF` accept it in place of raw data and skip their own checks.
+    """
+
+    __slots__ = ("data", "cost_mask")
+
+    def __init__(self, data: np.ndarray, cost_mask: Optional[np.ndarray] = None):
+        self.data = data
+        self.cost_mask = cost_mask
+
+    @property
+    def cost(self) -> list:
+        """Cost criteria indices, sorted and without duplicates."""
+        return [] if self.cost_mask is None else np.flatnonzero(self.cost_mask).tolist()
+
+    def __repr__(self):
+        return f"ValidatedNF(shape={self.data.shape}, cost={self.cost})"
+
+
+def _out_of_range(flat: np.ndarray) -> bool:
+    """One pass over the data: True if any value is NaN, infinite or outside [0, 1]."""
+    buf = np.empty(min(CHUNK_SIZE, flat.size))
+    for start in range(0, flat.size, CHUNK_SIZE):
+        chunk = flat[start:start + CHUNK_SIZE]
+        scratch = buf[:len(chunk)]
+        # |x - 0.5| <= 0.5 holds exactly on [0, 1]; NaN propagates through max
+        np.subtract(chunk, 0.5, out=scratch)
+        np.abs(scratch, out=scratch)
+        if not scratch.max() <= 0.5 + RANGE_TOLERANCE:
+            return True
+    return False
+
+
+def _describe(flat: np.ndarray) -> str:
+    """Error message for the first invalid value (only built on failure)."""
+    if np.isnan(flat).any():
+        return f"NF data contains NaN at flat position {int(np.flatnonzero(np.isnan(flat))[0])}."
+    if np.isinf(flat).any():
+        return f"NF data contains inf at flat position {int(np.flatnonzero(np.isinf(flat))[0])}."
+    bad = int(np.flatnonzero((flat < -RANGE_TOLERANCE) | (flat > 1 + RANGE_TOLERANCE))[0])
+    return f"NF value {flat[bad]!r} at flat position {bad} is outside [0, 1]."
+
+
+def validate_cost(cost: Sequence[int], n_criteria: int) -> np.ndarray:
+    """
+    Check cost criteria indices in one vectorized call.
+
+    Args:
+        cost (Sequence[int] | np.ndarray): Indices of the cost criteria, or a
+            boolean mask over the criteria (as in `RNF.cost_mask`)
+        n_criteria (int): Number of criteria (first axis of the NF data)
+
+    Returns:
+        np.ndarray: Boolean mask over the criteria.
+    """
+    if cost is None:
+        raise EmptyDataError("Cost index list cannot be None.")
+    idx = np.asarray(cost)
+    if idx.dtype == bool and idx.size:
+        if idx.shape != (n_criteria,):
+            raise ShapeMismatchError(idx.shape, (n_criteria,),
+                                     message=f"Cost mask of shape {idx.shape} does not match {n_criteria} criteria.")
+        return idx.copy()
+    mask = np.zeros(n_criteria, dtype=bool)
+    if idx.size == 0:
+        return mask
+    if idx.ndim != 1 or idx.dtype.kind not in "iu":
+        raise DataTypeError(message="Invalid element in cost list — must be integers.")
+    if idx.min() < 0 or idx.max() >= n_criteria:
+        bad = idx[(idx < 0) | (idx >= n_criteria)][0]
+        raise InvalidIndexError(int(bad), message=f"Cost index {int(bad)} is outside 0..{n_criteria - 1}.")
+    mask[idx] = True
+    return mask
+
+
+def validate_nf(data, cost: Optional[Sequence[int]] = None, copy: bool = True) -> ValidatedNF:
+    """
+    Validate NF data (and optionally cost indices) once, up front.
+
+    Checks, failing on the first problem: numeric content, a trailing
+    dimension of 4 ([Mu, T, I, F]), non-empty data, no NaN / inf, every value
+    in [0, 1], and integer cost indices within the criteria range.
+
+    Args:
+        data (List | np.ndarray): NF-set elements, components on the last axis
+        cost (Sequence[int], optional): Cost criteria indices
+        copy (bool): Give the token its own copy of the data. With False a
+            float64 array is used as is.
+
+    Returns:
+        ValidatedNF: Token accepted by `NFSet` and `RNF` without re-checking.
+    """
+    if data is None:
+        raise EmptyDataError("NFSet cannot be initialized with empty data.")
+    if not isinstance(data, (list, tuple, np.ndarray)):
+        raise DataTypeError(type(data))
+    try:
+        arr = np.array(data, dtype=float) if copy else np.asarray(data, dtype=float)
+    except (TypeError, ValueError):
+        raise DataTypeError(
+            received_type=type(data).__name__,
+            expected_type="numeric matrix (list[list[float]])",
+            message="Data contains non-numeric or ragged entries.",
+        )
+    if arr.size == 0:
+        raise EmptyDataError("NFSet cannot be initialized with empty data.")
+    if arr.ndim == 0 or arr.shape[-1] != 4:
+        raise ShapeMismatchError(arr.shape, (..., 4), message=f"NF data must end in 4 components, got shape {arr.shape}.")
+
+    flat = arr.reshape(-1)
+    if _out_of_range(flat):
+        raise DataTypeError(message=_describe(flat))
+
+    mask = None if cost is None else validate_cost(cost, arr.shape[0])
+    return ValidatedNF(arr, mask)
@@ -2,6 +2,8 @@ from .entropy_calculator import entropy_list, cross_entropy_list
 from .similarity_calculator import compute_similarity
 from .weight_calculator import compute_weight
 from .ranking_calculator import compute_normalized_scores
+from .histogram_calculator import detect_grade_scale, GradeHistogram
+from .aggregation_calculator import aggregate_experts
 
 __all__ = [
     "entropy_list",
@@ -9,4 +11,7 @@ __all__ = [
     "compute_similarity",
     "compute_weight",
     "compute_normalized_scores",
+    "detect_grade_scale",
+    "GradeHistogram",
+    "aggregate_experts",
 ]
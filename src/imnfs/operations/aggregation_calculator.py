@@ -0,0 +1,130 @@
+import numpy as np
+from typing import Iterable, Optional, Sequence, Union
+from imnfs.model import NFSet, ValidatedNF, validate_nf
+from imnfs.exceptions import (
+    EmptyDataError,
+    InvalidTypeError,
+    ShapeMismatchError,
+    WeightComputationError,
+)
+
+AGGREGATION_METHODS = ("mean", "intersection", "union")
+
+
+def _as_array(matrix) -> np.ndarray:
+    """NF matrix of one expert as a float array (NFSet, or array-like validated here)."""
+    if isinstance(matrix, NFSet):
+        return matrix.data
+    return validate_nf(matrix, copy=False).data
+
+
+def _expert_weights(weights, n_experts: Optional[int]) -> Optional[np.ndarray]:
+    """Validate reliability weights and normalize them to sum 1."""
+    if weights is None:
+        return None
+    weights = np.asarray(weights, dtype=float)
+    if weights.ndim != 1 or (n_experts is not None and len(weights) != n_experts):
+        raise ShapeMismatchError(weights.shape, (n_experts,))
+    if np.any(weights < 0) or not np.isfinite(weights).all() or weights.sum() == 0:
+        raise WeightComputationError("Expert weights must be finite, non-negative and not all zero.")
+    return weights / weights.sum()
+
+
+def aggregate_experts(
+    matrices: Union[np.ndarray, Iterable],
+    method: str = "mean",
+    weights: Optional[Sequence[float]] = None,
+    layout: str = "aos",
+) -> NFSet:
+    """
+    Combine the NF decision matrices of several experts into one NF-set.
+
+    Methods:
+        - "mean": weighted average of every component (weights = expert reliability)
+        - "intersection": Mu, T minimum and I, F maximum over experts
+        - "union": Mu, T maximum and I, F minimum over experts
+    For "intersection" and "union", experts with zero weight are left out.
+
+    A stacked array (experts, criteria, alternatives, 4) is reduced in one
+    vectorized call; any other iterable of matrices or NFSets is streamed into
+    a single accumulator, so no intermediate NFSet is built per expert.
+
+    Args:
+        matrices (np.ndarray | Iterable): Expert matrices, all of the same shape.
+            Arrays are checked once with `validate_nf`; NFSets are already valid.
+        method (str): "mean", "intersection" or "union".
+        weights (Sequence[float], optional): Reliability weight per expert.
+        layout (str): Storage layout of the returned NFSet.
+
+    Returns:
+        NFSet: Aggregated NF-set, ready for `RNF` / `DecisionMaker`.
+    """
+    if method not in AGGREGATION_METHODS:
+        raise InvalidTypeError(var_name="method", expected_type=AGGREGATION_METHODS, received_type=method)
+
+    if isinstance(matrices, np.ndarray):
+        out = _aggregate_stack(matrices, method, weights)
+    else:
+        out = _aggregate_stream(matrices, method, weights)
+    # Means, minima and maxima of validated inputs stay valid: no second check or copy
+    return NFSet(ValidatedNF(out), layout=layout)
+
+
+def _aggregate_stack(stack: np.ndarray, method: str, weights) -> np.ndarray:
+    """Reduce a stacked (experts, ..., 4) array in one vectorized pass."""
+    stack = np.asarray(stack, dtype=float)
+    if stack.ndim < 2 or stack.shape[0] == 0:
+        raise EmptyDataError("No expert matrices to aggregate.")
+    stack = validate_nf(stack, copy=False).data
+    w = _expert_weights(weights, stack.shape[0])
+
+    if method == "mean":
+        if w is None:
+            return stack.mean(axis=0)
+        return np.tensordot(w, stack, axes=1)
+
+    if w is not None:
+        stack = stack[w > 0]
+    lower, upper = (np.minimum, np.maximum) if method == "intersection" else (np.maximum, np.minimum)
+    out = np.empty(stack.shape[1:], dtype=float)
+    lower.reduce(stack[..., :2], axis=0, out=out[..., :2])
+    upper.reduce(stack[..., 2:], axis=0, out=out[..., 2:])
+    return out
+
+
+def _aggregate_stream(matrices: Iterable, method: str, weights) -> np.ndarray:
+    """Fold expert matrices one at a time into a single accumulator."""
+    w = _expert_weights(weights, None)
+    lower, upper = (np.minimum, np.maximum) if method == "intersection" else (np.maximum, np.minimum)
+
+    out, scratch, count = None, None, 0
+    for matrix in matrices:
+        arr = _as_array(matrix)
+        if out is not None and arr.shape != out.shape:
+            raise ShapeMismatchError(out.shape, arr.shape)
+        if w is not None and count >= len(w):
+            raise ShapeMismatchError(len(w), count + 1, message="More expert matrices than weights.")
+        weight = 1.0 if w is None else w[count]
+        count += 1
+
+        if method == "mean":
+            if out is None:
+                out = np.multiply(arr, weight)
+                scratch = np.empty_like(out)
+            else:
+                np.multiply(arr, weight, out=scratch)
+                out += scratch
+        elif weight > 0:
+            if out is None:
+                out = np.array(arr, dtype=float)
+            else:
+                lower(out[..., :2], arr[..., :2], out=out[..., :2])
+                upper(out[..., 2:], arr[..., 2:], out=out[..., 2:])
+
+    if count == 0 or out is None:
+        raise EmptyDataError("No expert matrices to aggregate.")
+    if w is not None and count != len(w):
+        raise ShapeMismatchError(len(w), count, message="Fewer expert matrices than weights.")
+    if method == "mean" and w is None:
+        out /= count
+    return out
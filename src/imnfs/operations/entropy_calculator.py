@@ -1,6 +1,7 @@
 import numpy as np
-from .similarity_calculator import compute_similarity
-from typing import List
+from .similarity_calculator import compute_similarity, compute_similarity_batch
+from .histogram_calculator import graded_histogram
+from typing import List, Union
 
 
 def entropy_with_complement(vectors: List[List[float]], k: int) -> float:
@@ -28,20 +29,28 @@ def entropy_with_complement(vectors: List[List[float]], k: int) -> float:
     return np.mean(similarities)
 
 
-def entropy_list(nf_elements: np.ndarray, k: int) -> List[float]:
+def entropy_list(nf_elements: np.ndarray, k: int, grade_scale: Union[int, str, None] = "auto") -> List[float]:
     """
     Compute entropy values for a list of NF-elements.
 
     Each NF-element is represented as a set of membership vectors,
     and the entropy is computed using its complement.
 
+    Graded data (values on a 1/L grid) is computed exactly from the counts
+    of distinct vectors instead of vector by vector.
+
     Args:
         nf_elements (np.ndarray): Array of NF-elements (each element is a list of vectors).
         k (int): The index of the membership degree to compute.
+        grade_scale (int | "auto" | None): Grade scale of the data; "auto" detects it
+            (and uses it when distinct vectors are few), None always uses the per-vector path.
 
     Returns:
         List[float]: A list of entropy values for each NF-element.
     """
+    histogram = graded_histogram(nf_elements, grade_scale)
+    if histogram is not None:
+        return (histogram.entropy_sums(k) / histogram.n).tolist()
     return [entropy_with_complement(elem, k) for elem in nf_elements]
 
 
@@ -71,17 +80,96 @@ def cross_entropy_pairwise(vectors: List[List[float]], k: int) -> List[float]:
     return out
 
 
-def cross_entropy_list(nf_elements: np.ndarray, k: int) -> List[float]:
+def cross_entropy_list(nf_elements: np.ndarray, k: int, grade_scale: Union[int, str, None] = "auto") -> List[float]:
     """
     Compute average cross-entropy for a list of NF-elements.
 
     Each NF-element group contributes one mean cross-entropy value.
+    Graded data is computed exactly from distinct-vector counts in O(K²).
 
     Args:
         nf_elements (np.ndarray): Array of NF-elements (each element is a list of vectors).
         k (int): The index of the membership degree to compute.
+        grade_scale (int | "auto" | None): Grade scale of the data; "auto" detects it
+            (and uses it when distinct vectors are few), None always uses the pairwise path.
 
     Returns:
         List[float]: Mean cross-entropy for each NF-element.
     """
+    histogram = graded_histogram(nf_elements, grade_scale)
+    if histogram is not None:
+        n = histogram.n
+        return (1 - histogram.cross_entropy_sums(k) / (n * (n - 1))).tolist()
     return [np.mean(cross_entropy_pairwise(elem, k)) for elem in nf_elements]
+
+
+# ----------------------------------------------------------------------
+# Partial sums (vectorized, used to merge results computed over shards)
+# ----------------------------------------------------------------------
+
+def entropy_sums(nf_elements: np.ndarray, k: int, component_axis: int = -1) -> np.ndarray:
+    """
+    Sum, per NF-element group, the similarity between each vector and its complement.
+
+    Dividing the result by the number of vectors gives `entropy_list`, so sums
+    computed over disjoint slices of the vectors can simply be added up.
+
+    Args:
+        nf_elements (np.ndarray): 3D array (groups, vectors, 4), or
+            (4, groups, vectors) when `component_axis=0`.
+        k (int): The index of the similarity measure to compute.
+        component_axis (int): -1 for row-major, 0 for component-major data.
+
+    Returns:
+        np.ndarray: One similarity sum per group.
+    """
+    data = np.asarray(nf_elements, dtype=float)
+    return np.sum(compute_similarity_batch(data, 1 - data, k, axis=component_axis), axis=1)
+
+
+def cross_entropy_block_sums(
+    x: np.ndarray,
+    y: np.ndarray,
+    k: int,
+    exclude_diagonal: bool = False,
+    tile_size: int = None,
+    component_axis: int = -1,
+) -> np.ndarray:
+    """
+    Sum, per NF-element group, the similarity over every pair in a block x × y.
+
+    With `exclude_diagonal=True` the block is treated as x × x and the pairs of
+    a vector with itself are left out, matching `cross_entropy_pairwise`.
+    The cross-entropy of a group of n vectors equals
+    `1 - total / (n * (n - 1))` where `total` is the sum over all blocks.
+
+    Args:
+        x (np.ndarray): 3D array (groups, rows, 4), or (4, groups, rows).
+        y (np.ndarray): 3D array (groups, cols, 4), or (4, groups, cols).
+        k (int): The index of the similarity measure to compute.
+        exclude_diagonal (bool): Drop the (i, i) pairs (requires x is y).
+        tile_size (int, optional): Rows of x processed per step. Defaults to
+            a size keeping the temporary around 32 MB.
+        component_axis (int): -1 for row-major, 0 for component-major data.
+
+    Returns:
+        np.ndarray: One similarity sum per group.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    soa = component_axis == 0
+    groups, rows, cols = (x.shape[1], x.shape[2], y.shape[2]) if soa else (x.shape[0], x.shape[1], y.shape[1])
+    if tile_size is None:
+        tile_size = max(1, (32 * 2**20) // max(1, groups * cols * 4 * 8))
+
+    # Broadcast rows of x against columns of y, components stay on their axis
+    y_cols = y[:, :, None, :] if soa else y[:, None, :, :]
+    total = np.zeros(groups, dtype=float)
+    for start in range(0, rows, tile_size):
+        tile = x[:, :, start:start + tile_size, None] if soa else x[:, start:start + tile_size, None, :]
+        sims = compute_similarity_batch(tile, y_cols, k, axis=component_axis)
+        total += np.sum(sims, axis=(1, 2))
+
+    if exclude_diagonal:
+        total -= np.sum(compute_similarity_batch(x, x, k, axis=component_axis), axis=1)
+    return total
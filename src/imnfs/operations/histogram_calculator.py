@@ -0,0 +1,315 @@
+import numpy as np
+from typing import List, Optional, Tuple, Union
+from imnfs.measures import get_measures
+from imnfs.exceptions import DataTypeError
+
+# Grade scales tried by `detect_grade_scale`, e.g. 10 -> steps of 0.1
+DEFAULT_GRADE_SCALES = (2, 4, 5, 10, 20, 100)
+
+# Tiles of the K x K distinct-tuple matrix are kept around this many entries
+# (about 32 MB of temporaries, like `cross_entropy_block_sums`)
+TILE_ENTRIES = 2**18
+
+# "auto" takes the count-based path only when no criterion has more distinct
+# tuples than this fraction of the alternatives (at least 64x fewer pairs)
+AUTO_DISTINCT_FRACTION = 1 / 8
+
+# Peak bytes of temporaries per tile entry (72 for distance-based measures,
+# 104 for separable ones) or per padded FFT grid entry (about 50, 80 when
+# separable)
+TILE_ENTRY_BYTES = 112
+
+# Peak bytes of quantizing, keying and `np.unique` per input element
+# (5x the float64 input, also covering the reference similarities)
+_BUILD_ELEMENT_BYTES = 40
+
+# Largest padded 4D grade grid autocorrelated by FFT
+_MAX_GRID_ENTRIES = 2**24
+
+
+def detect_grade_scale(data: np.ndarray, scales=DEFAULT_GRADE_SCALES, atol: float = 1e-9) -> Optional[int]:
+    """
+    Find the coarsest grade scale the NF data lies on.
+
+    A scale L means every value is a multiple of 1/L (L=10 for the 0.1 grid
+    of a 10-level linguistic scale).
+
+    Args:
+        data (np.ndarray): NF data, components on the last axis.
+        scales (tuple): Candidate scales, tried in increasing order.
+        atol (float): Tolerance on the distance to the grid.
+
+    Returns:
+        Optional[int]: The smallest matching scale, or None for continuous data.
+    """
+    data = np.asarray(data, dtype=float).ravel()
+    if data.size == 0:
+        return None
+
+    def on_grid(values, scale):
+        scaled = values * scale
+        return bool(np.all(np.abs(scaled - np.round(scaled)) <= atol * scale))
+
+    # Reject scales on a small sample before scanning the whole array
+    sample = data[:4096]
+    for scale in sorted(scales):
+        if on_grid(sample, scale) and on_grid(data, scale):
+            return int(scale)
+    return None
+
+
+def quantize(data: np.ndarray, scale: int, atol: float = 1e-9) -> np.ndarray:
+    """
+    Convert graded NF data into integer grade codes (value * scale).
+
+    Raises:
+        DataTypeError: If a value is not on the 1/scale grid.
+    """
+    scaled = np.asarray(data, dtype=float) * scale
+    codes = np.round(scaled)
+    if not np.all(np.abs(scaled - codes) <= atol * scale):
+        raise DataTypeError(message=f"NF data is not on the 1/{scale} grade scale.")
+    return codes.astype(np.int64)
+
+
+def resolve_grade_scale(data: np.ndarray, grade_scale: Union[int, str, None]) -> Optional[int]:
+    """
+    Resolve the `grade_scale` argument of the operations.
+
+    "auto" detects the scale, None disables the count-based path and an
+    integer forces that scale (the data must lie on it). `graded_histogram`
+    also drops "auto" when the data has too many distinct tuples.
+    """
+    if grade_scale is None:
+        return None
+    if isinstance(grade_scale, str):
+        if grade_scale != "auto":
+            raise DataTypeError(message=f"grade_scale must be 'auto', None or an integer, got '{grade_scale}'.")
+        return detect_grade_scale(data)
+    if not isinstance(grade_scale, int) or grade_scale < 1:
+        raise DataTypeError(message=f"grade_scale must be a positive integer, got {grade_scale!r}.")
+    return grade_scale
+
+
+def graded_histogram(nf_elements: np.ndarray, grade_scale: Union[int, str, None] = "auto",
+                     tile_entries: int = TILE_ENTRIES) -> Optional["GradeHistogram"]:
+    """
+    Histogram for the count-based path, or None for the per-vector path.
+
+    An integer scale always gives a histogram. With "auto" the scale is
+    detected and the histogram is kept only if it pays off: on fine grids
+    nearly every tuple is distinct (K close to n), and the K x K pairs cost
+    as much as the n x n ones.
+
+    Args:
+        nf_elements (np.ndarray): 3D array (criteria, alternatives, 4).
+        grade_scale (int | "auto" | None): As in `resolve_grade_scale`.
+        tile_entries (int): Passed to `GradeHistogram`.
+
+    Returns:
+        Optional[GradeHistogram]: The histogram, or None.
+    """
+    scale = resolve_grade_scale(nf_elements, grade_scale)
+    if scale is None:
+        return None
+    histogram = GradeHistogram(nf_elements, scale, tile_entries=tile_entries)
+    if isinstance(grade_scale, str) and max(histogram.distinct) > AUTO_DISTINCT_FRACTION * histogram.n:
+        return None
+    return histogram
+
+
+def grade_lut(k: int, scale: int, max_distance: int) -> Optional[np.ndarray]:
+    """
+    Lookup table of measure k over integer L1 grade distances 0..max_distance.
+
+    Returns None for measures that are not a function of the L1 distance.
+    """
+    measure = get_measures()[k]
+    if not measure.distance_based:
+        return None
+    # Distances beyond the [0, 1] range may leave a measure's domain
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return measure.from_distance(np.arange(max_distance + 1) / scale)
+
+
+def component_lut(k: int, scale: int, max_delta: int) -> Optional[np.ndarray]:
+    """
+    Lookup table of the component term of measure k over grade differences 0..max_delta.
+
+    The term is even, so a difference of -d reads entry d. Returns None for
+    measures that are not separable.
+    """
+    measure = get_measures()[k]
+    if not measure.separable:
+        return None
+    return measure.component_term(np.arange(max_delta + 1) / scale)
+
+
+class GradeHistogram:
+    """
+    Distinct graded NF tuples of every criterion with their counts.
+
+    Measures over n alternatives reduce to sums over the K distinct tuples
+    weighted by their counts, so cross-entropy costs O(K²) instead of O(n²)
+    and stays exact.
+    """
+
+    def __init__(self, nf_elements: np.ndarray, scale: int, tile_entries: int = TILE_ENTRIES):
+        """
+        Args:
+            nf_elements (np.ndarray): 3D array (criteria, alternatives, 4) on the 1/scale grid.
+            scale (int): Grade scale.
+            tile_entries (int): Entries per tile of the pairwise K x K matrix
+                (and largest FFT grid), which bounds cross-entropy temporaries
+                at about `tile_entries * TILE_ENTRY_BYTES`. A tile holds at least one row.
+        """
+        codes = quantize(nf_elements, scale)
+        self.scale = scale
+        self.tile_entries = max(1, int(tile_entries))
+        self.n = codes.shape[1]
+        self.low = min(int(codes.min()), 0)
+        self.high = max(int(codes.max()), scale)
+
+        # Pack each 4-tuple of codes into one integer key for a fast unique
+        base = self.high - self.low + 1
+        keys = ((((codes[..., 0] - self.low) * base + codes[..., 1] - self.low) * base
+                 + codes[..., 2] - self.low) * base + codes[..., 3] - self.low)
+
+        self.tuples: List[np.ndarray] = []
+        self.counts: List[np.ndarray] = []
+        self.inverse: List[np.ndarray] = []
+        for crit_keys in keys:
+            unique, inverse, counts = np.unique(crit_keys, return_inverse=True, return_counts=True)
+            digits = np.empty((len(unique), 4), dtype=np.int64)
+            rest = unique
+            for c in range(3, -1, -1):
+                rest, digits[:, c] = np.divmod(rest, base)
+            self.tuples.append(digits + self.low)
+            self.counts.append(counts.astype(float))
+            self.inverse.append(inverse.reshape(-1))
+
+    @staticmethod
+    def peak_bytes(criteria: int, n: int, distinct: int, tile_entries: int = TILE_ENTRIES) -> int:
+        """
+        Estimated peak temporary memory of building the histogram and computing
+        entropy, cross-entropy and reference similarities.
+
+        Args:
+            criteria (int): Number of criteria
+            n (int): Number of alternatives
+            distinct (int): Upper bound of distinct tuples per criterion
+            tile_entries (int): Tile size passed to the constructor; 0 leaves the
+                cross-entropy tiles out
+
+        Returns:
+            int: Bytes.
+        """
+        distinct = max(1, min(n, distinct))
+        # A tile spans whole rows of the K x K matrix, at least one
+        tile = max(1, tile_entries // distinct) * distinct if tile_entries else 0
+        return criteria * n * 4 * _BUILD_ELEMENT_BYTES + tile * TILE_ENTRY_BYTES
+
+    @property
+    def distinct(self) -> List[int]:
+        """Number of distinct tuples per criterion."""
+        return [len(t) for t in self.tuples]
+
+    def _lut(self, k: int) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Distance and component-term lookup tables of measure k (at most one is set)."""
+        # Cover pairwise, complement and reference differences of in-range codes
+        span = 2 * (self.high - self.low)
+        distance = grade_lut(k, self.scale, 4 * span)
+        return distance, None if distance is not None else component_lut(k, self.scale, span)
+
+    def _similarity(self, a: np.ndarray, b: np.ndarray, k: int, lut) -> np.ndarray:
+        """Similarity between broadcastable stacks of grade codes."""
+        distance, term = lut
+        if distance is not None:
+            return distance[np.sum(np.abs(a - b), axis=-1)]
+        if term is not None:
+            return get_measures()[k].from_component_sum(np.sum(term[np.abs(a - b)], axis=-1))
+        return get_measures()[k].compute_batch(a / self.scale, b / self.scale)
+
+    def entropy_sums(self, k: int) -> np.ndarray:
+        """Per-criterion sum of similarity(x, 1 - x) over all alternatives."""
+        lut = self._lut(k)
+        return np.array([
+            counts @ self._similarity(tuples, self.scale - tuples, k, lut)
+            for tuples, counts in zip(self.tuples, self.counts)
+        ])
+
+    def entropies(self, k: int):
+        """
+        Per-criterion entropy and cross-entropy, as `entropy_list` and `cross_entropy_list`.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Entropy and cross-entropy per criterion.
+        """
+        n = self.n
+        return self.entropy_sums(k) / n, 1 - self.cross_entropy_sums(k) / (n * (n - 1))
+
+    def pair_distance_counts(self, tuples: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """
+        Number of ordered alternative pairs (self-pairs included) at each L1 grade distance.
+
+        Computed as the autocorrelation of the 4D grade histogram, so the cost
+        depends on the grid size rather than on the number of distinct tuples.
+        """
+        auto, lags = self._autocorrelation(tuples, counts)
+        dist = (lags[:, None, None, None] + lags[None, :, None, None]
+                + lags[None, None, :, None] + lags[None, None, None, :])
+        return np.bincount(dist.ravel(), weights=auto.ravel(), minlength=4 * (self.high - self.low) + 1)
+
+    def _autocorrelation(self, tuples: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Pair counts at every 4D lag, and the |lag| of each FFT bin along one axis."""
+        span = self.high - self.low
+        size = 2 * span + 1
+        grid = np.zeros((span + 1,) * 4)
+        grid[tuple((tuples - self.low).T)] = counts
+
+        spectrum = np.fft.rfftn(grid, s=(size,) * 4)
+        auto = np.rint(np.fft.irfftn(spectrum * np.conj(spectrum), s=(size,) * 4))
+
+        # |lag| of every FFT bin along one axis: 0..span, then span..1
+        lags = np.abs(np.fft.fftfreq(size, 1 / size)).round().astype(np.int64)
+        return auto, lags
+
+    def cross_entropy_sums(self, k: int) -> np.ndarray:
+        """Per-criterion similarity sum over all ordered pairs (i, j), i != j."""
+        lut = self._lut(k)
+        distance, term = lut
+        grid_entries = (2 * (self.high - self.low) + 1) ** 4
+        out = []
+        for tuples, counts in zip(self.tuples, self.counts):
+            dense = grid_entries <= min(len(tuples) ** 2, _MAX_GRID_ENTRIES, self.tile_entries)
+            if dense and distance is not None:
+                # Dense grid: count pairs per distance, then one dot with the LUT
+                pairs = self.pair_distance_counts(tuples, counts)
+                out.append(pairs @ distance[:len(pairs)] - self.n * distance[0])
+                continue
+            if dense and term is not None:
+                # Dense grid: similarity of every 4D lag from the component terms
+                auto, lags = self._autocorrelation(tuples, counts)
+                t = term[lags]
+                sums = t[:, None, None, None] + t[None, :, None, None] + t[None, None, :, None] + t[None, None, None, :]
+                sims = get_measures()[k].from_component_sum(sums)
+                out.append(np.sum(auto * sims) - self.n * sims[0, 0, 0, 0])
+                continue
+            tile = max(1, self.tile_entries // len(tuples))
+            total = 0.0
+            for start in range(0, len(tuples), tile):
+                sims = self._similarity(tuples[start:start + tile, None, :], tuples[None, :, :], k, lut)
+                total += counts[start:start + tile] @ sims @ counts
+            # Remove the pairs of an alternative with itself
+            total -= counts @ self._similarity(tuples, tuples, k, lut)
+            out.append(total)
+        return np.array(out)
+
+    def reference_similarity(self, reference: np.ndarray, k: int) -> np.ndarray:
+        """Similarity of every alternative to a reference vector, shape (criteria, alternatives)."""
+        lut = self._lut(k)
+        ref = quantize(reference, self.scale)
+        return np.stack([
+            self._similarity(tuples, ref, k, lut)[inverse]
+            for tuples, inverse in zip(self.tuples, self.inverse)
+        ])
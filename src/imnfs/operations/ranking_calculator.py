@@ -1,74 +1,117 @@
 import numpy as np
+from typing import Optional, Union
 from imnfs.model import RNF
-from .similarity_calculator import compute_similarity
-from .weight_calculator import compute_weight  # assuming compute_weight is here
+from .similarity_calculator import compute_similarity, compute_similarity_batch
+from .histogram_calculator import GradeHistogram, graded_histogram
+from .weight_calculator import _weights
 
+# Ideal reference vectors [Mu, T, I, F]
+POSITIVE_REFERENCE = np.array([1, 1, 0, 0], dtype=float)
+NEGATIVE_REFERENCE = np.array([0, 0, 1, 1], dtype=float)
 
-def compute_positive_similarity_scores(rnf: RNF, index: int) -> list:
+
+def _reference_scores(rnf: RNF, index: int, reference: np.ndarray, weights: np.ndarray,
+                      histogram: Optional[GradeHistogram]) -> np.ndarray:
+    """Weighted similarity of each column to `reference`, from the histogram when there is one."""
+    if histogram is not None:
+        return weights @ histogram.reference_similarity(reference, index)
+
+    out = []
+
+    for i in range(rnf.data.shape[1]):
+        temp = np.sum([weights[j] * compute_similarity(rnf.data[j][i], reference)[index]
+                    for j in range(rnf.data.shape[0])])
+        out.append(temp)
+
+    return np.array(out)
+
+
+def compute_positive_similarity_scores(rnf: RNF, index: int, grade_scale: Union[int, str, None] = "auto") -> list:
     """
     Compute positive scores for each column of the NF-set.
 
     Args:
         rnf: RNF object or 3D array of NF-elements
         index (int): index of component to use
+        grade_scale (int | "auto" | None): Grade scale for the count-based path
 
     Returns:
         List of positive scores per column
     """
-    # Define positive reference vector
-    pos = np.array([1, 1, 0, 0], dtype=float)
-    
-    weights = np.array(compute_weight(rnf, index))
-    out = []
-    
-    for i in range(rnf.data.shape[1]):
-        temp = np.sum([weights[j] * compute_similarity(rnf.data[j][i], pos)[index]
-                    for j in range(rnf.data.shape[0])])
-        out.append(temp)
-
-    return out
+    histogram = graded_histogram(rnf.data, grade_scale)
+    weights = _weights(rnf, index, histogram)
+    return _reference_scores(rnf, index, POSITIVE_REFERENCE, weights, histogram).tolist()
 
 
-def compute_negative_similarity_scores(rnf: RNF, index: int) -> list:
+def compute_negative_similarity_scores(rnf: RNF, index: int, grade_scale: Union[int, str, None] = "auto") -> list:
     """
     Compute negative scores for each column of the NF-set.
 
     Args:
         rnf: RNF object or 3D array of NF-elements
         index (int): index of component to use
+        grade_scale (int | "auto" | None): Grade scale for the count-based path
 
     Returns:
         List of negative scores per column
     """
-    # Define negative reference vector
-    neg = np.array([0, 0, 1, 1], dtype=float)
-
-    weights = np.array(compute_weight(rnf, index))
-    out = []
-
-    for i in range(rnf.data.shape[1]):
-        temp = np.sum([weights[j] * compute_similarity(rnf.data[j][i], neg)[index]
-                    for j in range(rnf.data.shape[0])])
-        out.append(temp)
-
-    return out
+    histogram = graded_histogram(rnf.data, grade_scale)
+    weights = _weights(rnf, index, histogram)
+    return _reference_scores(rnf, index, NEGATIVE_REFERENCE, weights, histogram).tolist()
 
 
-def compute_normalized_scores(rnf: RNF, index: int) -> list:
+def compute_normalized_scores(rnf: RNF, index: int, grade_scale: Union[int, str, None] = "auto") -> list:
     """
     Compute final scores for each column as Spos / (Spos + Sneg).
 
+    The grade histogram and the weights are computed once and shared by
+    both reference scores.
+
     Args:
         rnf: RNF object or 3D array of NF-elements
         index (int): index of component to use
+        grade_scale (int | "auto" | None): Grade scale for the count-based path
 
     Returns:
         List of normalized scores per column
     """
-    spos_scores = np.array(compute_positive_similarity_scores(rnf, index))
-    sneg_scores = np.array(compute_negative_similarity_scores(rnf, index))
+    histogram = graded_histogram(rnf.data, grade_scale)
+    weights = _weights(rnf, index, histogram)
+    spos_scores = _reference_scores(rnf, index, POSITIVE_REFERENCE, weights, histogram)
+    sneg_scores = _reference_scores(rnf, index, NEGATIVE_REFERENCE, weights, histogram)
 
     # calculate score
     scores = spos_scores / (spos_scores + sneg_scores)
 
     return scores.tolist()
+
+
+def weighted_reference_scores(
+    data: np.ndarray,
+    weights,
+    reference: np.ndarray,
+    index: int,
+    component_axis: int = -1,
+) -> np.ndarray:
+    """
+    Vectorized weighted similarity of every column to a reference vector.
+
+    Equivalent to the per-column sums of `compute_positive_similarity_scores`
+    (with POSITIVE_REFERENCE) or `compute_negative_similarity_scores`
+    (with NEGATIVE_REFERENCE), for any slice of columns.
+
+    Args:
+        data (np.ndarray): 3D array (criteria, columns, 4), or (4, criteria, columns)
+        weights (array-like): One weight per criterion
+        reference (np.ndarray): Reference NF vector
+        index (int): index of component to use
+        component_axis (int): -1 for row-major, 0 for component-major data
+
+    Returns:
+        np.ndarray: Weighted score per column
+    """
+    if component_axis == 0:
+        reference = np.asarray(reference, dtype=float)[:, None, None]
+    sims = compute_similarity_batch(np.asarray(data, dtype=float), reference, index, axis=component_axis)
+    return np.asarray(weights, dtype=float) @ sims
+
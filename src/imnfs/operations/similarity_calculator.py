@@ -17,3 +17,21 @@ def compute_similarity(a: np.ndarray, b: np.ndarray) ->List[float]:
     result = [sim.compute(a, b) for sim in similarity_list]
 
     return result
+
+
+def compute_similarity_batch(a: np.ndarray, b: np.ndarray, index: int, axis: int = -1) -> np.ndarray:
+    """
+    Calculate one similarity measure between broadcastable stacks of NF-set vectors.
+
+    Args:
+        a (array-like): First stack of NF-set vectors.
+        b (array-like): Second stack of NF-set vectors.
+        index (int): Index of the similarity measure (0..8).
+        axis (int): Component axis, -1 for row-major, 0 for component-major data.
+
+    Returns:
+        np.ndarray: Similarity values with the broadcast shape of `a` and `b`
+        minus the component axis.
+    """
+    measure = get_measures()[index]
+    return measure.compute_batch(a, b, axis=axis)
@@ -1,33 +1,54 @@
 import numpy as np
-from typing import List
+from typing import List, Optional, Union
 from .entropy_calculator import entropy_list, cross_entropy_list
+from .histogram_calculator import GradeHistogram, graded_histogram
 from imnfs.model import RNF
 
 
-def compute_weight(rnf: RNF, index: int) -> List[float]:
+def compute_weight(rnf: RNF, index: int, grade_scale: Union[int, str, None] = "auto") -> List[float]:
     """
     Compute normalized weights for NF-elements based on entropy and cross-entropy.
 
     Args:
         rnf (RNF): RNF object containing NF-set data
         index (int): Index of component (Mu, T, I, F) to use in entropy calculations
+        grade_scale (int | "auto" | None): Grade scale for the count-based path
 
     Returns:
         List[float]: Normalized weights (sum equals 1)
     """
+    # Convert to list for compatibility with legacy code
+    return _weights(rnf, index, graded_histogram(rnf.data, grade_scale)).tolist()
+
+
+def _weights(rnf: RNF, index: int, histogram: Optional[GradeHistogram]) -> np.ndarray:
+    """Weights from a prebuilt histogram, or from the per-vector path when it is None."""
+    if histogram is not None:
+        return weights_from_entropy(*histogram.entropies(index))
 
     # Compute entropy values for the NF-set at the given index
-    entropy_vals = np.array(entropy_list(rnf.data, index))
+    entropy_vals = np.array(entropy_list(rnf.data, index, grade_scale=None))
 
     # Compute cross-entropy values pairwise for the NF-set at the given index
-    cross_entropy_vals = np.array(cross_entropy_list(rnf.data, index))
+    cross_entropy_vals = np.array(cross_entropy_list(rnf.data, index, grade_scale=None))
+
+    return weights_from_entropy(entropy_vals, cross_entropy_vals)
+
+
+def weights_from_entropy(entropy_vals: np.ndarray, cross_entropy_vals: np.ndarray) -> np.ndarray:
+    """
+    Combine per-criterion entropy and cross-entropy into normalized weights.
 
+    Args:
+        entropy_vals (np.ndarray): Entropy per criterion
+        cross_entropy_vals (np.ndarray): Cross-entropy per criterion
+
+    Returns:
+        np.ndarray: Normalized weights (sum equals 1)
+    """
     # Combine entropy and cross-entropy to compute raw weights
     # Formula: raw_weight = 1 - entropy + cross_entropy
-    raw_weights = 1 - entropy_vals + cross_entropy_vals
+    raw_weights = 1 - np.asarray(entropy_vals) + np.asarray(cross_entropy_vals)
 
     # Normalize weights so that their sum equals 1
-    normalized_weights = raw_weights / np.sum(raw_weights)
-
-    # Convert to list for compatibility with legacy code
-    return normalized_weights.tolist()
\ No newline at end of file
+    return raw_weights / np.sum(raw_weights)
\ No newline at end of file
@@ -0,0 +1,17 @@
+from .memory import (
+    MemoryProfiler,
+    StageMemory,
+    PIPELINE_STAGES,
+    PIPELINE_BUDGETS,
+    profile_pipeline,
+    check_budgets,
+)
+
+__all__ = [
+    "MemoryProfiler",
+    "StageMemory",
+    "PIPELINE_STAGES",
+    "PIPELINE_BUDGETS",
+    "profile_pipeline",
+    "check_budgets",
+]
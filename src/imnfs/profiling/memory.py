@@ -0,0 +1,204 @@
+"""
+Peak and retained memory accounting for the load -> NFSet -> RNF -> weights
+-> scores pipeline.
+
+Python objects and NumPy data buffers are both traced by `tracemalloc`
+(NumPy reports its buffers in the `np.lib.tracemalloc_domain` domain), so a
+stage's peak covers list conversions, array copies and pairwise temporaries.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Union
+import numpy as np
+
+from imnfs.exceptions import MemoryBudgetError, ProfilerUsageError
+
+PIPELINE_STAGES = ("load", "nfset", "rnf", "weights", "scores")
+
+# Per-stage budget: (multiple of the input tensor's bytes, fixed allowance in bytes).
+# "load" includes the Python lists built while parsing text formats; the
+# allowance of "weights" / "scores" covers the lookup tables and grade grid of
+# the count-based path. Tiled plans are bounded by the planner's memory budget.
+PIPELINE_BUDGETS = {
+    "load": (16.0, 1 * 2**20),
+    "nfset": (1.25, 64 * 2**10),
+    "rnf": (1.75, 64 * 2**10),
+    "weights": (8.0, 16 * 2**20),
+    "scores": (8.0, 16 * 2**20),
+}
+
+class StageMemory:
+    """
+    Memory used by one pipeline stage.
+
+    Attributes:
+        stage (str): Stage name
+        peak_bytes (int): Highest traced usage during the stage, above its starting level
+        retained_bytes (int): Traced bytes still allocated when the stage ends
+        numpy_retained_bytes (int): Part of `retained_bytes` held by NumPy data buffers
+        seconds (float): Wall time of the stage (tracing included)
+    """
+
+    __slots__ = ("stage", "peak_bytes", "retained_bytes", "numpy_retained_bytes", "seconds")
+
+    def __init__(self, stage: str, peak_bytes: int, retained_bytes: int,
+                 numpy_retained_bytes: int, seconds: float):
+        self.stage = stage
+        self.peak_bytes = peak_bytes
+        self.retained_bytes = retained_bytes
+        self.numpy_retained_bytes = numpy_retained_bytes
+        self.seconds = seconds
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return (f"StageMemory({self.stage}: peak={self.peak_bytes / 2**20:.2f} MiB, "
+                f"retained={self.retained_bytes / 2**20:.2f} MiB)")
+
+
+def _numpy_bytes(snapshot: tracemalloc.Snapshot) -> int:
+    numpy_only = snapshot.filter_traces([tracemalloc.DomainFilter(True, np.lib.tracemalloc_domain)])
+    return sum(stat.size for stat in numpy_only.statistics("filename"))
+
+
+class MemoryProfiler:
+    """
+    Records peak and retained bytes of named stages with `tracemalloc`.
+
+    Example:
+        >>> with MemoryProfiler() as profiler:
+        ...     with profiler.stage("nfset"):
+        ...         nfs = NFSet(data)
+        >>> profiler["nfset"].peak_bytes
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, StageMemory] = {}
+        self._started = False
+
+    def __enter__(self) -> "MemoryProfiler":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        return self
+
+    def __exit__(self, *exc):
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def __getitem__(self, stage: str) -> StageMemory:
+        return self.stages[stage]
+
+    @contextmanager
+    def stage(self, name: str):
+        """Measure the block as stage `name`; objects it keeps alive count as retained."""
+        if not tracemalloc.is_tracing():
+            raise ProfilerUsageError("MemoryProfiler.stage must be used inside `with MemoryProfiler()`.")
+        numpy_before = _numpy_bytes(tracemalloc.take_snapshot())
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            seconds = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            numpy_after = _numpy_bytes(tracemalloc.take_snapshot())
+            self.stages[name] = StageMemory(
+                name,
+                peak_bytes=max(0, peak - before),
+                retained_bytes=current - before,
+                numpy_retained_bytes=numpy_after - numpy_before,
+                seconds=seconds,
+            )
+
+    def report(self) -> List[dict]:
+        """Stage records as dicts, in execution order."""
+        return [s.to_dict() for s in self.stages.values()]
+
+
+def profile_pipeline(
+    source: Union[str, np.ndarray],
+    cost: Optional[list] = None,
+    index: int = 0,
+    layout: str = "aos",
+    planner=None,
+) -> MemoryProfiler:
+    """
+    Run load -> NFSet -> RNF -> weights -> scores under the profiler.
+
+    Args:
+        source (str | np.ndarray): Data file for `load_nf_tensor`, or an in-memory tensor
+        cost (list, optional): Cost criteria indices
+        index (int): Similarity measure used for weights and scores
+        layout (str): Storage layout of the NFSet / RNF
+        planner (ExecutionPlanner, optional): Compute weights and scores with its plan
+            (planning itself is not measured). Defaults to the standard operations.
+
+    Returns:
+        MemoryProfiler: One `StageMemory` per stage in PIPELINE_STAGES, plus
+        `input_bytes`, the size of the loaded (criteria, alternatives, 4) tensor.
+    """
+    from imnfs.io.loader import load_nf_tensor, table_to_tensor
+    from imnfs.model import NFSet, RNF
+    from imnfs.operations import compute_weight, compute_normalized_scores
+
+    with MemoryProfiler() as profiler:
+        with profiler.stage("load"):
+            data = load_nf_tensor(source) if isinstance(source, str) else table_to_tensor(source)
+        with profiler.stage("nfset"):
+            nfs = NFSet(data, layout=layout)
+        with profiler.stage("rnf"):
+            rnf = RNF(nfs, cost or [])
+        plan = planner.plan(rnf) if planner is not None else None
+        with profiler.stage("weights"):
+            if plan is None:
+                compute_weight(rnf, index)
+            else:
+                plan.compute_weight(rnf, index)
+        with profiler.stage("scores"):
+            if plan is None:
+                compute_normalized_scores(rnf, index)
+            else:
+                plan.compute_normalized_scores(rnf, index)
+
+    profiler.plan = plan
+    profiler.input_bytes = int(rnf.data.nbytes)
+    return profiler
+
+
+def check_budgets(
+    profiler: MemoryProfiler,
+    input_bytes: int,
+    budgets: Optional[dict] = None,
+) -> Dict[str, int]:
+    """
+    Compare each stage's peak with its budget.
+
+    Args:
+        profiler (MemoryProfiler): Profiled stages
+        input_bytes (int): Size of the NF tensor the budgets scale with
+        budgets (dict, optional): {stage: (factor, allowance)}. Defaults to PIPELINE_BUDGETS.
+
+    Returns:
+        Dict[str, int]: Budget in bytes of every checked stage.
+
+    Raises:
+        MemoryBudgetError: Listing every stage whose peak exceeds its budget.
+    """
+    budgets = PIPELINE_BUDGETS if budgets is None else budgets
+    limits, failures = {}, []
+    for name, (factor, allowance) in budgets.items():
+        if name not in profiler.stages:
+            continue
+        limits[name] = int(factor * input_bytes + allowance)
+        peak = profiler[name].peak_bytes
+        if peak > limits[name]:
+            failures.append(f"{name}: peak {peak} B > budget {limits[name]} B")
+    if failures:
+        raise MemoryBudgetError("Memory budget exceeded - " + "; ".join(failures))
+    return limits
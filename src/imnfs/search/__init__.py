@@ -0,0 +1,3 @@
+from .index import SimilarityIndex
+
+__all__ = ["SimilarityIndex"]
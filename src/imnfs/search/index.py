@@ -0,0 +1,252 @@
+import heapq
+import json
+from pathlib import Path
+from typing import Optional, Tuple, Union
+import numpy as np
+
+from imnfs.model import RNF
+from imnfs.measures import get_measures
+from imnfs.exceptions import (
+    DataTypeError,
+    EmptyDataError,
+    InvalidIndexError,
+    InvalidTypeError,
+    ShapeMismatchError,
+)
+
+INDEX_FORMAT_VERSION = 1
+
+
+class SimilarityIndex:
+    """
+    Exact k-nearest-neighbour index over the alternatives of an NF tensor.
+
+    Each alternative is the concatenation of its per-criterion [Mu, T, I, F]
+    vectors (or the single vector of one criterion with `criterion=`), stored
+    in a KD-tree searched under the L1 distance.
+
+    The similarity of two profiles over C criteria is the measure applied to
+    their mean per-criterion L1 distance, `f(sum|a - b| / C)`. Measures 2-9
+    are decreasing functions of that distance, so the L1 nearest neighbours
+    are exactly the most similar alternatives. Similarity1 is not a function
+    of the L1 distance; it is answered by an exact linear scan using the mean
+    of the per-criterion Similarity1 values.
+
+    The two aggregations differ: for C > 1, the values returned under
+    Similarity1 and under measures 2-9 are on different footings and their
+    values and orderings must not be compared across measures. With one
+    criterion (C = 1) both reduce to the plain measure of two NF vectors.
+
+    Pruning is most effective in low dimension (a per-criterion index) or on
+    correlated / graded profiles; many independent criteria push the search
+    towards a full scan, while results stay exact.
+    """
+
+    def __init__(self, data: Union[RNF, np.ndarray], criterion: Optional[int] = None, leaf_size: int = 256):
+        """
+        Build the index.
+
+        Args:
+            data (RNF | np.ndarray): RNF object or 3D array (criteria, alternatives, 4)
+            criterion (int, optional): Index a single criterion instead of the full profile
+            leaf_size (int): Maximum number of alternatives per KD-tree leaf
+        """
+        arr = data.data if isinstance(data, RNF) else np.asarray(data, dtype=float)
+        if arr.ndim != 3 or arr.shape[2] != 4:
+            raise ShapeMismatchError(arr.shape, ("criteria", "alternatives", 4))
+        if arr.shape[1] == 0:
+            raise EmptyDataError("Cannot index an NF tensor without alternatives.")
+        if not isinstance(leaf_size, int) or leaf_size < 1:
+            raise InvalidTypeError(message="leaf_size must be a positive integer.")
+
+        if criterion is not None:
+            if not isinstance(criterion, int) or not 0 <= criterion < arr.shape[0]:
+                raise InvalidIndexError(criterion, message=f"Invalid criterion index '{criterion}'.")
+            arr = arr[criterion:criterion + 1]
+
+        self.criterion = criterion
+        self.n_criteria = arr.shape[0]
+        self.leaf_size = leaf_size
+
+        # Alternatives as rows of concatenated per-criterion vectors
+        points = np.ascontiguousarray(np.swapaxes(arr, 0, 1).reshape(arr.shape[1], -1))
+        self._build(points)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    # ----------------------------------------------------------------------
+    # KD-tree construction
+    # ----------------------------------------------------------------------
+
+    def _build(self, points: np.ndarray):
+        order = np.arange(len(points))
+        starts, ends, lefts, rights, lows, highs = [], [], [], [], [], []
+
+        def build(start: int, end: int) -> int:
+            node = len(starts)
+            block = points[order[start:end]]
+            starts.append(start)
+            ends.append(end)
+            lefts.append(-1)
+            rights.append(-1)
+            lows.append(block.min(axis=0))
+            highs.append(block.max(axis=0))
+            if end - start > self.leaf_size:
+                dim = int(np.argmax(highs[node] - lows[node]))
+                mid = (start + end) // 2
+                sub = order[start:end]
+                order[start:end] = sub[np.argpartition(points[sub, dim], mid - start)]
+                lefts[node] = build(start, mid)
+                rights[node] = build(mid, end)
+            return node
+
+        build(0, len(points))
+        self.order = order
+        self.points = points[order]
+        self.start = np.array(starts)
+        self.end = np.array(ends)
+        self.left = np.array(lefts)
+        self.right = np.array(rights)
+        self.low = np.array(lows)
+        self.high = np.array(highs)
+
+    # ----------------------------------------------------------------------
+    # Queries
+    # ----------------------------------------------------------------------
+
+    def _profile(self, vector) -> np.ndarray:
+        """Flatten a query: one [Mu, T, I, F] vector (applied to every criterion) or a full profile."""
+        q = np.asarray(vector, dtype=float)
+        if q.shape == (4,):
+            q = np.tile(q, self.n_criteria)
+        q = q.reshape(-1)
+        if q.shape[0] != self.points.shape[1]:
+            raise ShapeMismatchError(np.shape(vector), (self.n_criteria, 4))
+        return q
+
+    @staticmethod
+    def _measure(measure: int):
+        if not isinstance(measure, int) or not 0 <= measure < 9:
+            raise InvalidIndexError(measure, message=f"Invalid measure index '{measure}'. Expected 0..8.")
+        return get_measures()[measure]
+
+    def _nearest(self, q: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Best-first KD-tree search for the k smallest L1 distances."""
+        best_d = np.full(k, np.inf)
+        best_p = np.zeros(k, dtype=int)
+        worst = np.inf
+        frontier = [(0.0, 0)]
+        while frontier:
+            bound, node = heapq.heappop(frontier)
+            if bound > worst:
+                break
+            left = self.left[node]
+            if left < 0:
+                s, e = self.start[node], self.end[node]
+                dist = np.abs(self.points[s:e] - q).sum(axis=1)
+                # Ties with the current k-th distance may still win on a lower index
+                hit = dist <= worst
+                if hit.any():
+                    cand_d = np.concatenate([best_d, dist[hit]])
+                    cand_p = np.concatenate([best_p, np.flatnonzero(hit) + s])
+                    keep = np.lexsort((self.order[cand_p], cand_d))[:k]
+                    best_d, best_p = cand_d[keep], cand_p[keep]
+                    worst = best_d.max()
+                continue
+            children = (left, self.right[node])
+            gaps = np.maximum(self.low[children, :] - q, 0) + np.maximum(q - self.high[children, :], 0)
+            for child, b in zip(children, gaps.sum(axis=1).tolist()):
+                if b <= worst:
+                    heapq.heappush(frontier, (b, child))
+
+        ranked = np.lexsort((self.order[best_p], best_d))
+        return self.order[best_p[ranked]], best_d[ranked]
+
+    def _scan(self, q: np.ndarray, k: int, measure) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact linear scan for measures that are not a function of the L1 distance."""
+        sims = measure.compute_batch(
+            self.points.reshape(len(self.points), self.n_criteria, 4),
+            q.reshape(self.n_criteria, 4),
+        ).mean(axis=1)
+        top = np.arange(len(sims))
+        if k < len(sims):
+            # Keep everything tied with the k-th value, then break ties by index
+            kth = np.partition(-sims, k - 1)[k - 1]
+            top = np.flatnonzero(-sims <= kth)
+        top = top[np.lexsort((self.order[top], -sims[top]))][:k]
+        return self.order[top], sims[top]
+
+    def query(self, vector, k: int = 1, measure: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k alternatives most similar to a profile.
+
+        Args:
+            vector (array-like): (criteria, 4) profile, its flattened form, or a
+                single [Mu, T, I, F] vector such as an ideal reference
+            k (int): Number of neighbours
+            measure (int): Index of the similarity measure (0..8)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: 0-based alternative indices and their
+            similarities, most similar first (ties by lower index). Measures 2-9
+            return `f(sum|a - b| / C)`, Similarity1 the mean per-criterion
+            similarity, so values are only comparable within one measure.
+        """
+        if not isinstance(k, int) or k < 1:
+            raise InvalidTypeError(message="k must be a positive integer.")
+        k = min(k, len(self))
+        sim = self._measure(measure)
+        q = self._profile(vector)
+        if not sim.distance_based:
+            return self._scan(q, k, sim)
+        indices, distances = self._nearest(q, k)
+        return indices, sim.from_distance(distances / self.n_criteria)
+
+    def query_batch(self, vectors, k: int = 1, measure: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run `query` for several profiles.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Arrays of shape (queries, k).
+        """
+        results = [self.query(v, k, measure) for v in vectors]
+        return np.stack([r[0] for r in results]), np.stack([r[1] for r in results])
+
+    # ----------------------------------------------------------------------
+    # Persistence
+    # ----------------------------------------------------------------------
+
+    def save(self, filepath: str) -> Path:
+        """Write the index to a NumPy .npz file."""
+        filepath = Path(filepath)
+        meta = {
+            "version": INDEX_FORMAT_VERSION,
+            "criterion": self.criterion,
+            "n_criteria": self.n_criteria,
+            "leaf_size": self.leaf_size,
+        }
+        with open(filepath, "wb") as f:
+            np.savez(
+                f,
+                meta=np.array(json.dumps(meta)),
+                points=self.points, order=self.order,
+                start=self.start, end=self.end, left=self.left, right=self.right,
+                low=self.low, high=self.high,
+            )
+        return filepath
+
+    @classmethod
+    def load(cls, filepath: str) -> "SimilarityIndex":
+        """Read an index written by `save`."""
+        with np.load(filepath, allow_pickle=False) as f:
+            meta = json.loads(str(f["meta"]))
+            if meta.get("version") != INDEX_FORMAT_VERSION:
+                raise DataTypeError(message=f"Unsupported index format version {meta.get('version')!r}.")
+            index = cls.__new__(cls)
+            index.criterion = meta["criterion"]
+            index.n_criteria = meta["n_criteria"]
+            index.leaf_size = meta["leaf_size"]
+            for name in ("points", "order", "start", "end", "left", "right", "low", "high"):
+                setattr(index, name, f[name])
+        return index